@@ -8,22 +8,33 @@ compatibility with existing task parsing infrastructure.
 
 import time
 
+from collections.abc import Sequence
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import IntEnum
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
+if TYPE_CHECKING:
+    from spec_driven_workflow.task_generator import ParsedTask
 
-class ExecutionMode(Enum):
+
+class ExecutionMode(IntEnum):
     """Execution mode for auto-run operations.
     
     AUTOMATIC: Execute all tasks without user intervention
     INTERACTIVE: Prompt user before each task execution
+
+    Members are ordinals so comparisons stay on the integer fast path;
+    ``str()`` returns the serialized name used in state files.
     """
-    AUTOMATIC = "automatic"
-    INTERACTIVE = "interactive"
+    AUTOMATIC = 0
+    INTERACTIVE = 1
+
+    def __str__(self) -> str:
+        return _EXECUTION_MODE_VALUES[self]
 
 
-class TaskStatus(Enum):
+class TaskStatus(IntEnum):
     """Status enumeration for individual task execution.
     
     SUCCESS: Task completed successfully
@@ -32,14 +43,35 @@ class TaskStatus(Enum):
     RUNNING: Task is currently executing
     PENDING: Task has not started execution yet
     """
-    SUCCESS = "success"
-    FAILED = "failed"
-    SKIPPED = "skipped"
-    RUNNING = "running"
-    PENDING = "pending"
+    SUCCESS = 0
+    FAILED = 1
+    SKIPPED = 2
+    RUNNING = 3
+    PENDING = 4
+
+    def __str__(self) -> str:
+        return _TASK_STATUS_VALUES[self]
+
+
+# Serialized string forms, indexed by enum ordinal
+_EXECUTION_MODE_VALUES = ("automatic", "interactive")
+_TASK_STATUS_VALUES = ("success", "failed", "skipped", "running", "pending")
+
+_EXECUTION_MODE_BY_VALUE = {
+    value: ExecutionMode(ordinal) for ordinal, value in enumerate(_EXECUTION_MODE_VALUES)
+}
+
+# Statuses after which a task result is no longer updated
+_TERMINAL_STATUSES = frozenset((TaskStatus.SUCCESS, TaskStatus.FAILED, TaskStatus.SKIPPED))
+
+# AutoRunResult summary messages: (no failures, with failures)
+_SUMMARY_TEMPLATES = (
+    "✅ Auto-run completed successfully: {successful}/{total} tasks completed",
+    "⚠️ Auto-run completed with issues: {successful} successful, {failed} failed, {skipped} skipped",
+)
 
 
-@dataclass
+@dataclass(slots=True)
 class AutoRunOptions:
     """Configuration options for automated task execution.
     
@@ -48,48 +80,91 @@ class AutoRunOptions:
     used in task_generator.py.
     """
     execution_mode: ExecutionMode = ExecutionMode.AUTOMATIC
-    task_selection: str | None = None  # "all", "1-3", "2,4,6", specific task IDs
+    task_selection: str | None = "all"  # "all", "1-3", "2,4,6", specific task IDs; None selects all
     continue_on_error: bool = False
     show_detailed_progress: bool = True
     resume_from_task: str | None = None
-
-    def __post_init__(self) -> None:
-        """Validate configuration after initialization."""
-        if self.task_selection is None:
-            self.task_selection = "all"
+    explicit_task_ids: list[str] | None = None  # pre-validated IDs; overrides task_selection
 
 
-@dataclass
 class TaskResult:
     """Result of individual task execution.
     
     Captures execution details, status, and metadata for a single task
     to enable comprehensive reporting and error handling.
+    
+    Written as a plain ``__slots__`` class rather than a dataclass since it
+    is constructed once per task execution and retry.
     """
-    task_id: str
-    task_description: str
-    status: TaskStatus
-    execution_time: float = 0.0
-    error_message: str | None = None
-    requirements_addressed: list[str] | None = None
-    leverage_info: str | None = None
-    start_time: float | None = field(default_factory=time.time)
-    end_time: float | None = None
+    __slots__ = (
+        'task_id',
+        'task_description',
+        'status',
+        'execution_time',
+        'error_message',
+        'requirements_addressed',
+        'leverage_info',
+        'start_time',
+        'end_time',
+    )
+
+    def __init__(
+        self,
+        task_id: str,
+        task_description: str,
+        status: TaskStatus,
+        *,
+        execution_time: float = 0.0,
+        error_message: str | None = None,
+        requirements_addressed: Sequence[str] | None = None,
+        leverage_info: str | None = None,
+        start_time: float | None = None,
+        end_time: float | None = None,
+    ) -> None:
+        self.task_id = task_id
+        self.task_description = task_description
+        self.status = status
+        self.execution_time = execution_time
+        self.error_message = error_message
+        self.requirements_addressed = requirements_addressed
+        self.leverage_info = leverage_info
+        self.start_time = start_time
+        self.end_time = end_time
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"TaskResult({fields})"
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    __hash__ = None  # type: ignore[assignment]
 
     def mark_started(self) -> None:
         """Mark the task as started and record the start time."""
         self.status = TaskStatus.RUNNING
         self.start_time = time.time()
 
-    def mark_completed(self, success: bool = True, error_message: str | None = None) -> None:
+    def mark_completed(
+        self, success: bool = True, error_message: str | None = None, now: float | None = None
+    ) -> None:
         """Mark the task as completed with success or failure status.
         
+        Calling this again on a task that has already finished is a no-op.
+        
         Args:
             success: Whether the task completed successfully
             error_message: Error message if a task failed
+            now: Completion timestamp to reuse; defaults to the current time
         """
-        self.end_time = time.time()
-        if self.start_time:
+        if self.status in _TERMINAL_STATUSES:
+            # Already completed; keep the first recorded timing and outcome
+            return
+
+        self.end_time = time.time() if now is None else now
+        if self.start_time is not None:
             self.execution_time = self.end_time - self.start_time
 
         if success:
@@ -98,18 +173,19 @@ class TaskResult:
             self.status = TaskStatus.FAILED
             self.error_message = error_message
 
-    def mark_skipped(self, reason: str | None = None) -> None:
+    def mark_skipped(self, reason: str | None = None, now: float | None = None) -> None:
         """Mark the task as skipped with an optional reason.
         
         Args:
             reason: Reason why the task was skipped
+            now: Skip timestamp to reuse; defaults to the current time
         """
         self.status = TaskStatus.SKIPPED
         self.error_message = reason
-        self.end_time = time.time()
+        self.end_time = time.time() if now is None else now
 
 
-@dataclass
+@dataclass(slots=True)
 class AutoRunResult:
     """Comprehensive result of auto-run execution.
     
@@ -118,15 +194,65 @@ class AutoRunResult:
     """
     spec_name: str
     total_tasks: int
-    executed_tasks: int = 0
-    successful_tasks: int = 0
-    failed_tasks: int = 0
-    skipped_tasks: int = 0
     execution_time: float = 0.0
     task_results: list[TaskResult] = field(default_factory=list)
     summary_message: str = ""
-    start_time: float | None = field(default_factory=time.time)
+    start_time: float | None = None
     end_time: float | None = None
+    # Per-status tallies indexed by TaskStatus ordinal
+    _counters: list[int] = field(
+        default_factory=lambda: [0] * len(TaskStatus), init=False, repr=False, compare=False
+    )
+    # Backing store for executed_tasks
+    _executed_tasks: int = field(default=0, init=False, repr=False, compare=False)
+    # Memoized success_rate; negative means stale
+    _success_rate_cache: float = field(default=-1.0, init=False, repr=False, compare=False)
+    # Status ordinal of each task result, kept parallel to task_results
+    _statuses: bytearray = field(default_factory=bytearray, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Index the statuses of any task results supplied at construction."""
+        self._statuses = bytearray(result.status for result in self.task_results)
+
+    @property
+    def executed_tasks(self) -> int:
+        """Number of tasks that were executed."""
+        return self._executed_tasks
+
+    @executed_tasks.setter
+    def executed_tasks(self, value: int) -> None:
+        self._executed_tasks = value
+        self._success_rate_cache = -1.0
+
+    @property
+    def successful_tasks(self) -> int:
+        """Number of tasks that completed successfully."""
+        return self._counters[TaskStatus.SUCCESS]
+
+    @successful_tasks.setter
+    def successful_tasks(self, value: int) -> None:
+        self._counters[TaskStatus.SUCCESS] = value
+        self._success_rate_cache = -1.0
+
+    @property
+    def failed_tasks(self) -> int:
+        """Number of tasks that failed."""
+        return self._counters[TaskStatus.FAILED]
+
+    @failed_tasks.setter
+    def failed_tasks(self, value: int) -> None:
+        self._counters[TaskStatus.FAILED] = value
+        self._success_rate_cache = -1.0
+
+    @property
+    def skipped_tasks(self) -> int:
+        """Number of tasks that were skipped."""
+        return self._counters[TaskStatus.SKIPPED]
+
+    @skipped_tasks.setter
+    def skipped_tasks(self, value: int) -> None:
+        self._counters[TaskStatus.SKIPPED] = value
+        self._success_rate_cache = -1.0
 
     def add_task_result(self, result: TaskResult) -> None:
         """Add a task result and update summary statistics.
@@ -135,14 +261,10 @@ class AutoRunResult:
             result: TaskResult to add to the collection
         """
         self.task_results.append(result)
-        self.executed_tasks += 1
-
-        if result.status == TaskStatus.SUCCESS:
-            self.successful_tasks += 1
-        elif result.status == TaskStatus.FAILED:
-            self.failed_tasks += 1
-        elif result.status == TaskStatus.SKIPPED:
-            self.skipped_tasks += 1
+        self._statuses.append(result.status)
+        self._executed_tasks += 1
+        self._counters[result.status] += 1
+        self._success_rate_cache = -1.0
 
     def update_last_task_result(self, result: TaskResult) -> None:
         """Update the last task result (for retry scenarios).
@@ -153,44 +275,56 @@ class AutoRunResult:
         Args:
             result: New TaskResult to replace the last one
         """
-        if not self.task_results:
-            # No previous results, just add the new one
+        last_idx = len(self.task_results) - 1
+        if last_idx < 0:
+            # Cold path: no previous result to replace, just add the new one
             self.add_task_result(result)
             return
 
-        # Get the old result and update statistics
-        old_result = self.task_results[-1]
-
-        # Adjust counters for the old result
-        if old_result.status == TaskStatus.SUCCESS:
-            self.successful_tasks -= 1
-        elif old_result.status == TaskStatus.FAILED:
-            self.failed_tasks -= 1
-        elif old_result.status == TaskStatus.SKIPPED:
-            self.skipped_tasks -= 1
-
-        # Replace the last result
-        self.task_results[-1] = result
-
-        # Update counters for the new result
-        if result.status == TaskStatus.SUCCESS:
-            self.successful_tasks += 1
-        elif result.status == TaskStatus.FAILED:
-            self.failed_tasks += 1
-        elif result.status == TaskStatus.SKIPPED:
-            self.skipped_tasks += 1
-
-    def finalize(self) -> None:
-        """Finalize the auto-run result with timing and summary message."""
-        self.end_time = time.time()
-        if self.start_time:
+        # Hot path (retry): swap the old result's tally for the new one
+        self._counters[self.task_results[last_idx].status] -= 1
+        self._counters[result.status] += 1
+        self.task_results[last_idx] = result
+        self._statuses[last_idx] = result.status
+        self._success_rate_cache = -1.0
+
+    def results_with_status(self, status: TaskStatus) -> list[TaskResult]:
+        """Get the task results with a given status, in execution order.
+        
+        Scans the parallel status column instead of every TaskResult, so only
+        matching results are touched.
+        
+        Args:
+            status: Status to select
+            
+        Returns:
+            Matching task results
+        """
+        statuses = self._statuses
+        matches = []
+        idx = statuses.find(status)
+        while idx >= 0:
+            matches.append(self.task_results[idx])
+            idx = statuses.find(status, idx + 1)
+        return matches
+
+    def finalize(self, now: float | None = None) -> None:
+        """Finalize the auto-run result with timing and summary message.
+        
+        Args:
+            now: Completion timestamp to reuse; defaults to the current time
+        """
+        self.end_time = time.time() if now is None else now
+        if self.start_time is not None:
             self.execution_time = self.end_time - self.start_time
 
-        # Generate summary message
-        if self.failed_tasks == 0:
-            self.summary_message = f"✅ Auto-run completed successfully: {self.successful_tasks}/{self.total_tasks} tasks completed"
-        else:
-            self.summary_message = f"⚠️ Auto-run completed with issues: {self.successful_tasks} successful, {self.failed_tasks} failed, {self.skipped_tasks} skipped"
+        # Generate summary message, indexed by whether any task failed
+        self.summary_message = _SUMMARY_TEMPLATES[self.failed_tasks != 0].format(
+            successful=self.successful_tasks,
+            failed=self.failed_tasks,
+            skipped=self.skipped_tasks,
+            total=self.total_tasks,
+        )
 
     @property
     def success_rate(self) -> float:
@@ -199,9 +333,11 @@ class AutoRunResult:
         Returns:
             Success rate as a float between 0.0 and 1.0
         """
-        if self.executed_tasks == 0:
-            return 0.0
-        return self.successful_tasks / self.executed_tasks
+        if self._success_rate_cache < 0:
+            if self.executed_tasks == 0:
+                return 0.0
+            self._success_rate_cache = self.successful_tasks / self.executed_tasks
+        return self._success_rate_cache
 
     @property
     def is_successful(self) -> bool:
@@ -213,12 +349,15 @@ class AutoRunResult:
         return self.failed_tasks == 0 and self.executed_tasks > 0
 
 
-@dataclass
+@dataclass(slots=True)
 class SpecContext:
     """Context information for a specification during auto-run execution.
     
     Consolidates all necessary documents and metadata needed for task execution,
     following the pattern established in the existing spec workflow system.
+    
+    Subclasses should also be declared with ``@dataclass(slots=True)`` to keep
+    the slotted layout; a plain subclass silently regains a ``__dict__``.
     """
     spec_name: str
     requirements_content: str
@@ -226,17 +365,18 @@ class SpecContext:
     tasks_content: str
     steering_documents: dict[str, str] = field(default_factory=dict)  # filename -> content
     spec_directory: Path = field(default_factory=Path)
+    parsed_tasks: 'list[ParsedTask] | None' = None  # parsed once from tasks_content by the runner
 
     def __post_init__(self) -> None:
         """Validate that required content is present."""
-        if not self.spec_name:
-            raise ValueError("spec_name is required")
-        if not self.requirements_content:
-            raise ValueError("requirements_content is required")
-        if not self.design_content:
-            raise ValueError("design_content is required")
-        if not self.tasks_content:
-            raise ValueError("tasks_content is required")
+        for name, value in (
+            ('spec_name', self.spec_name),
+            ('requirements_content', self.requirements_content),
+            ('design_content', self.design_content),
+            ('tasks_content', self.tasks_content),
+        ):
+            if not value:
+                raise ValueError(f"{name} is required")
 
     @property
     def has_steering_documents(self) -> bool:
@@ -259,7 +399,7 @@ class SpecContext:
         return self.steering_documents.get(filename)
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionState:
     """Execution state for auto-run persistence and recovery.
     
@@ -277,11 +417,76 @@ class ExecutionState:
     current_task_id: str | None = None
     total_tasks: int = 0
     interruption_reason: str | None = None
+    # Membership indexes mirroring the ordered task ID lists
+    _completed_set: set[str] = field(default_factory=set, init=False, repr=False, compare=False)
+    _failed_set: set[str] = field(default_factory=set, init=False, repr=False, compare=False)
+    _skipped_set: set[str] = field(default_factory=set, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """Set last_updated to the current time if not provided."""
-        if not hasattr(self, 'last_updated') or self.last_updated == 0:
+        if self.last_updated == 0:
             self.last_updated = time.time()
+        self._completed_set = set(self.completed_task_ids)
+        self._failed_set = set(self.failed_task_ids)
+        self._skipped_set = set(self.skipped_task_ids)
+
+    def add_completed(self, task_id: str) -> None:
+        """Record a task as completed.
+        
+        Args:
+            task_id: ID of the completed task
+        """
+        self.completed_task_ids.append(task_id)
+        self._completed_set.add(task_id)
+
+    def discard_completed(self, task_id: str) -> None:
+        """Remove a task from the completed list if present.
+        
+        Args:
+            task_id: ID of the task to remove
+        """
+        if task_id in self._completed_set:
+            self.completed_task_ids.remove(task_id)
+            self._completed_set.discard(task_id)
+
+    def is_task_done(self, task_id: str) -> bool:
+        """Check whether a task was completed or skipped and needs no rerun.
+        
+        Args:
+            task_id: ID of the task
+            
+        Returns:
+            True if the task is recorded as completed or skipped
+        """
+        return task_id in self._completed_set or task_id in self._skipped_set
+
+    def record_task_result(self, task_id: str, status: TaskStatus) -> None:
+        """Record the latest outcome of a task, replacing any earlier outcome.
+        
+        Set lookups keep the common case (first outcome for a task) free of
+        list scans; the ordered lists are only searched when a retried task
+        actually has to be moved.
+        
+        Args:
+            task_id: ID of the task
+            status: Outcome of the task; non-terminal statuses only clear it
+        """
+        self.discard_completed(task_id)
+        if task_id in self._failed_set:
+            self.failed_task_ids.remove(task_id)
+            self._failed_set.discard(task_id)
+        if task_id in self._skipped_set:
+            self.skipped_task_ids.remove(task_id)
+            self._skipped_set.discard(task_id)
+
+        if status == TaskStatus.SUCCESS:
+            self.add_completed(task_id)
+        elif status == TaskStatus.FAILED:
+            self.failed_task_ids.append(task_id)
+            self._failed_set.add(task_id)
+        elif status == TaskStatus.SKIPPED:
+            self.skipped_task_ids.append(task_id)
+            self._skipped_set.add(task_id)
 
     @property
     def next_task_id(self) -> str | None:
@@ -290,7 +495,7 @@ class ExecutionState:
         Returns:
             Task ID to resume from, or None if no resumption is needed
         """
-        if self.current_task_id and self.current_task_id not in self.completed_task_ids:
+        if self.current_task_id and self.current_task_id not in self._completed_set:
             return self.current_task_id
         return None
 
@@ -318,9 +523,12 @@ class ExecutionState:
             (self.current_task_id is not None or len(self.completed_task_ids) > 0)
         )
 
-    def to_dict(self) -> dict:
+    def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization.
         
+        The task ID lists are returned by reference, so the result must be
+        treated as read-only.
+        
         Returns:
             Dictionary representation of the state
         """
@@ -329,11 +537,12 @@ class ExecutionState:
             'start_time': self.start_time,
             'last_updated': self.last_updated,
             'options': {
-                'execution_mode': self.options.execution_mode.value,
+                'execution_mode': _EXECUTION_MODE_VALUES[self.options.execution_mode],
                 'task_selection': self.options.task_selection,
                 'continue_on_error': self.options.continue_on_error,
                 'show_detailed_progress': self.options.show_detailed_progress,
-                'resume_from_task': self.options.resume_from_task
+                'resume_from_task': self.options.resume_from_task,
+                'explicit_task_ids': self.options.explicit_task_ids
             },
             'completed_task_ids': self.completed_task_ids,
             'failed_task_ids': self.failed_task_ids,
@@ -344,7 +553,7 @@ class ExecutionState:
         }
 
     @classmethod
-    def from_dict(cls, data: dict) -> 'ExecutionState':
+    def from_dict(cls, data: dict[str, Any]) -> 'ExecutionState':
         """Create ExecutionState from the dictionary.
         
         Args:
@@ -355,11 +564,13 @@ class ExecutionState:
         """
         options_data = data.get('options', {})
         options = AutoRunOptions(
-            execution_mode=ExecutionMode(options_data.get('execution_mode', 'automatic')),
-            task_selection=options_data.get('task_selection'),
+            # An unknown mode raises KeyError so a damaged state is discarded, not resumed
+            execution_mode=_EXECUTION_MODE_BY_VALUE[options_data.get('execution_mode', 'automatic')],
+            task_selection=options_data.get('task_selection') or 'all',
             continue_on_error=options_data.get('continue_on_error', False),
             show_detailed_progress=options_data.get('show_detailed_progress', True),
-            resume_from_task=options_data.get('resume_from_task')
+            resume_from_task=options_data.get('resume_from_task'),
+            explicit_task_ids=options_data.get('explicit_task_ids')
         )
 
         return cls(
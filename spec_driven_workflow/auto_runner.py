@@ -6,17 +6,24 @@ progress reporting used throughout the project.
 """
 
 import asyncio
+import codecs
+import functools
+import importlib
 import json
+import os
 import re
 import shlex
+import signal
 import subprocess
+import sys
 import time
 
 from pathlib import Path
+from collections.abc import Callable
+from types import ModuleType
+from typing import Any, ClassVar
 
-import aiofiles
-
-from rich.console import Console
+from rich.console import Console, Group, RenderableType
 from rich.progress import (
     BarColumn,
     MofNCompleteColumn,
@@ -26,13 +33,9 @@ from rich.progress import (
     TextColumn,
     TimeElapsedColumn,
 )
-
-# Enhanced inquirer integration following established patterns from cli.py
-try:
-    import inquirer
-    INQUIRER_AVAILABLE = True
-except ImportError:
-    INQUIRER_AVAILABLE = False
+from rich.rule import Rule
+from rich.table import Table
+from rich.text import Text
 
 from spec_driven_workflow.auto_run_models import (
     AutoRunOptions,
@@ -45,14 +48,515 @@ from spec_driven_workflow.auto_run_models import (
 )
 from spec_driven_workflow.task_generator import ParsedTask, parse_tasks_from_markdown
 
-# Claude Code SDK integration for proper command execution
+# Faster JSON for execution-state checkpoints when orjson is installed
+_dumps_state: Callable[[dict[str, Any]], bytes]
+_loads_state: Callable[[bytes], Any]
 try:
-    from claude_code_sdk import query, ClaudeCodeOptions, Message
-    CLAUDE_SDK_AVAILABLE = True
+    import orjson
+
+    _dumps_state = functools.partial(orjson.dumps, option=orjson.OPT_INDENT_2)
+    _loads_state = orjson.loads
 except ImportError:
-    CLAUDE_SDK_AVAILABLE = False
-    # Fallback to subprocess approach if SDK not available
-    from spec_driven_workflow.utils import find_claude_executable
+    def _json_dumps_state(data: dict[str, Any]) -> bytes:
+        return json.dumps(data, indent=2).encode('utf-8')
+
+    _dumps_state = _json_dumps_state
+    _loads_state = json.loads
+
+# Subprocess fallback when the Claude Code SDK is not available
+from spec_driven_workflow.utils import find_claude_executable
+
+
+@functools.lru_cache(maxsize=1)
+def _get_inquirer() -> ModuleType | None:
+    """Import inquirer on first use; most runs never reach a prompt.
+    
+    Returns:
+        The inquirer module if installed, None otherwise
+    """
+    try:
+        return importlib.import_module("inquirer")
+    except ImportError:
+        return None
+
+
+@functools.lru_cache(maxsize=1)
+def _get_claude_sdk() -> ModuleType | None:
+    """Import the Claude Code SDK on first task execution.
+    
+    Returns:
+        The claude_code_sdk module if installed, None otherwise
+    """
+    try:
+        return importlib.import_module("claude_code_sdk")
+    except ImportError:
+        return None
+
+# Claude executable path for the subprocess fallback, resolved once per process
+_claude_executable: str | None = None
+
+
+async def _get_claude_executable() -> str | None:
+    """Resolve the Claude executable once and reuse it for later tasks.
+    
+    Lookup failures are not cached so a later task can still find it.
+    
+    Returns:
+        Path to Claude executable if found, None otherwise
+    """
+    global _claude_executable
+    if _claude_executable is None:
+        _claude_executable = await find_claude_executable()
+    return _claude_executable
+
+
+def _serialize_state(state: ExecutionState) -> tuple[bytes, int]:
+    """Serialize an execution state for its state file.
+    
+    Args:
+        state: ExecutionState to serialize
+        
+    Returns:
+        The JSON payload and a hash of every field except ``last_updated``,
+        which changes on each save even when nothing else does
+    """
+    data = state.to_dict()
+    content_hash = hash(repr({key: value for key, value in data.items() if key != 'last_updated'}))
+    return _dumps_state(data), content_hash
+
+
+def _get_parsed_tasks(spec_context: SpecContext) -> list[ParsedTask]:
+    """Get the tasks parsed from a spec's tasks.md, parsing on first use.
+    
+    Args:
+        spec_context: Loaded spec whose tasks_content should be parsed
+        
+    Returns:
+        List of parsed tasks, cached on the context and shared across callers
+    """
+    if spec_context.parsed_tasks is None:
+        spec_context.parsed_tasks = parse_tasks_from_markdown(spec_context.tasks_content)
+    return spec_context.parsed_tasks
+
+
+# A task ID ends at whitespace, the end of the line, or a dot that does not start
+# a subtask number, so "2" never matches "2.1" (same rule as _mark_checkbox_line)
+_TASK_ID_END = r'(?=\s|$|\.(?!\d))'
+
+
+@functools.lru_cache(maxsize=512)
+def _task_complete_pattern(task_id: str) -> re.Pattern[str]:
+    """Compile the tasks.md checkbox pattern for a task ID once per process.
+    
+    Args:
+        task_id: ID of the task to match
+        
+    Returns:
+        Compiled multiline pattern matching the task's unchecked line
+    """
+    return re.compile(rf'^(-\s*)\[\s*\]\s*({re.escape(task_id)}{_TASK_ID_END}.*?)$', re.MULTILINE)
+
+
+@functools.lru_cache(maxsize=4096)
+def _hierarchical_sort_key(task_id: str) -> tuple[float, ...]:
+    """Create a sort key for hierarchical task ordering, cached per task ID.
+    
+    Args:
+        task_id: Task ID such as "2" or "2.1"
+        
+    Returns:
+        Tuple of numeric parts padded to three levels; non-numeric IDs sort last
+    """
+    # Split task ID into numeric parts (e.g., "2.1" -> [2, 1])
+    try:
+        parts = [float(part) for part in task_id.split('.')]
+    except ValueError:
+        # Fallback for non-numeric task IDs
+        return (float('inf'), 0, 0)
+
+    # Pad to ensure consistent sorting (e.g., [2] -> [2, 0])
+    while len(parts) < 3:  # Support up to 3 levels (1.2.3)
+        parts.append(0)
+    return tuple(parts)
+
+
+def _parse_dotted_int_parts(task_id: str) -> list[int] | None:
+    """Split a task ID such as "2.1" into integers without relying on int() failing.
+    
+    Args:
+        task_id: Task ID to split
+        
+    Returns:
+        Integer parts, or None if any part is empty or not ASCII digits
+    """
+    parts = task_id.split(".")
+    for part in parts:
+        if not (part.isascii() and part.isdigit()):
+            return None
+    return [int(part) for part in parts]
+
+
+# Parent prefix of a subtask range that the fast selection parser can emit as-is
+_CANONICAL_PREFIX_RE = re.compile(r'(?:0|[1-9][0-9]*)(?:\.(?:0|[1-9][0-9]*))*')
+
+
+def _parse_selection_fast(selection: str) -> list[str] | None:
+    """Parse a plain selection such as "1,3-5,2.1-2.3" in a single pass.
+    
+    Only handles selections made of ASCII digits, dots, commas and dashes.
+    Anything else, including malformed ranges, is left to the full parser so
+    users see its error messages.
+    
+    Args:
+        selection: Selection string
+        
+    Returns:
+        Deduplicated task IDs in selection order, or None to use the full parser
+    """
+    task_ids: list[str] = []
+    seen: set[str] = set()
+    start = 0
+    dash = -1
+    length = len(selection)
+
+    for i in range(length + 1):
+        ch = selection[i] if i < length else ","
+        if ch == "-":
+            if dash >= 0:
+                return None
+            dash = i
+            continue
+        if ch != ",":
+            if ch != "." and not "0" <= ch <= "9":
+                return None
+            continue
+
+        if dash < 0:
+            # Single task ID; empty parts are skipped like in the full parser
+            if i > start:
+                task_id = selection[start:i]
+                if task_id not in seen:
+                    seen.add(task_id)
+                    task_ids.append(task_id)
+        else:
+            first = selection[start:dash]
+            last = selection[dash + 1:i]
+            if not first or not last:
+                return None
+
+            first_dot = first.rfind(".")
+            last_dot = last.rfind(".")
+            if first_dot < 0 and last_dot < 0:
+                range_ids = [str(n) for n in range(int(first), int(last) + 1)]
+            else:
+                prefix = first[:first_dot]
+                if (first_dot < 0 or last_dot < 0 or prefix != last[:last_dot]
+                        or not _CANONICAL_PREFIX_RE.fullmatch(prefix)):
+                    return None
+                first_num = first[first_dot + 1:]
+                last_num = last[last_dot + 1:]
+                if not first_num or not last_num:
+                    return None
+                range_ids = [f"{prefix}.{n}" for n in range(int(first_num), int(last_num) + 1)]
+
+            if not range_ids:
+                # Reversed range; let the full parser report it
+                return None
+            for task_id in range_ids:
+                if task_id not in seen:
+                    seen.add(task_id)
+                    task_ids.append(task_id)
+
+        start = i + 1
+        dash = -1
+
+    return task_ids
+
+
+async def _drain_stream(
+    stream: asyncio.StreamReader,
+    queue: asyncio.Queue[tuple[str, bytes]],
+    tag: str,
+    buffer_size: int,
+) -> None:
+    """Read a subprocess stream to EOF, forwarding each chunk to a queue.
+    
+    Args:
+        stream: Stream to read
+        queue: Queue that receives (tag, chunk) items, then (tag, b"") at EOF
+        tag: Label identifying the stream in queued items
+        buffer_size: Maximum bytes per read
+    """
+    try:
+        while chunk := await stream.read(buffer_size):
+            await queue.put((tag, chunk))
+    finally:
+        queue.put_nowait((tag, b""))
+
+
+def _read_choice(prompt: str) -> str:
+    """Read a single-key answer for the fallback prompts.
+    
+    On a terminal the key is read without waiting for Enter; otherwise, or if
+    the terminal cannot be switched to cbreak mode, a full line is read with input().
+    
+    Args:
+        prompt: Prompt text to show
+        
+    Returns:
+        The key pressed, or the line entered
+    """
+    if not sys.stdin.isatty():
+        return input(prompt)
+
+    # The prompt is already on screen, so the line-based fallback must not repeat it
+    print(prompt, end='', flush=True)
+    if sys.platform == 'win32':
+        try:
+            import msvcrt
+
+            choice = msvcrt.getwch()
+        except (ImportError, OSError):
+            return input()
+    else:
+        try:
+            import termios
+            import tty
+        except ImportError:
+            return input()
+
+        try:
+            fd = sys.stdin.fileno()
+            old_settings = termios.tcgetattr(fd)
+            try:
+                tty.setcbreak(fd)
+                choice = os.read(fd, 1).decode('utf-8', errors='ignore')
+            finally:
+                termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+        except (termios.error, OSError):
+            return input()
+
+    print(choice if choice.isprintable() else '')
+    return choice
+
+
+def _signal_process_group(process: asyncio.subprocess.Process, force: bool) -> None:
+    """Terminate or kill a subprocess together with the process group it leads.
+    
+    Processes that do not lead their own group (or on Windows) are signalled
+    individually, so the caller's own group is never targeted.
+    
+    Args:
+        process: Subprocess to signal
+        force: Send SIGKILL instead of SIGTERM
+    """
+    if os.name != 'nt':
+        try:
+            if os.getpgid(process.pid) == process.pid:
+                os.killpg(process.pid, signal.SIGKILL if force else signal.SIGTERM)
+                return
+        except ProcessLookupError:
+            return  # Already exited and reaped
+
+    if force:
+        process.kill()
+    else:
+        process.terminate()
+
+
+# Completion patterns that indicate Claude is done
+COMPLETION_PATTERNS = (
+    "Human:",  # Claude is waiting for human input
+    "Assistant:",  # Claude is waiting in conversation mode
+    "Type 'exit' to quit",  # Claude session prompt
+    "Press any key to continue",  # Claude waiting for input
+    "Would you like me to",  # Claude asking for next steps
+    "Is there anything else",  # Claude offering additional help
+    "Let me know if you need",  # Claude offering more assistance
+)
+
+# Error patterns that indicate failure
+ERROR_PATTERNS = (
+    "Error:",
+    "Failed:",
+    "Command not found",
+    "Permission denied",
+    "No such file or directory",
+)
+
+# Each pattern list as one case-insensitive alternation, scanned once per chunk
+_COMPLETION_RE = re.compile("|".join(map(re.escape, COMPLETION_PATTERNS)), re.IGNORECASE)
+_ERROR_RE = re.compile("|".join(map(re.escape, ERROR_PATTERNS)), re.IGNORECASE)
+
+# Characters of earlier output re-scanned with each chunk, so a pattern split across reads still matches
+_PATTERN_OVERLAP = max(map(len, COMPLETION_PATTERNS + ERROR_PATTERNS)) - 1
+
+# Trailing window of output searched for completion patterns when the process goes quiet
+_MAX_PAT_TAIL = max(map(len, COMPLETION_PATTERNS)) * 4
+
+
+# Directories and file types ignored when snapshotting project files
+_EXCLUDED_SCAN_DIRS = frozenset({'.git', '__pycache__', '.pytest_cache', 'node_modules', '.venv', 'venv'})
+_EXCLUDED_SCAN_EXTENSIONS = frozenset({'.pyc', '.pyo', '.log', '.tmp'})
+
+
+def _scan_file_states(root: str) -> dict[str, int]:
+    """Walk a project tree with os.scandir and record each file's modification time.
+    
+    Excluded directories are pruned rather than filtered afterwards, and
+    symlinks are not followed.
+    
+    Args:
+        root: Project root directory
+        
+    Returns:
+        Dictionary mapping root-relative paths to st_mtime_ns
+    """
+    file_states: dict[str, int] = {}
+    prefix_len = len(os.path.join(root, ''))
+    stack = [root]
+
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            # Skip directories we can't read
+            continue
+
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in _EXCLUDED_SCAN_DIRS:
+                            stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        if os.path.splitext(entry.name)[1] in _EXCLUDED_SCAN_EXTENSIONS:
+                            continue
+                        file_states[entry.path[prefix_len:]] = entry.stat(follow_symlinks=False).st_mtime_ns
+                except OSError:
+                    # Skip files we can't read
+                    continue
+
+    return file_states
+
+
+def _mark_checkbox_line(content: str, task_id: str) -> str | None:
+    """Check off the canonical "- [ ] <id>" line of a task with plain string search.
+    
+    The ID must be followed by whitespace, the end of the line, or a dot that
+    does not start a subtask number, so marking "2" never touches "2.1".
+    
+    Args:
+        content: tasks.md content
+        task_id: ID of the task to mark complete
+        
+    Returns:
+        Updated content, or None if no such line exists
+    """
+    marker = f"- [ ] {task_id}"
+    end_of_content = len(content)
+    idx = content.find(marker)
+
+    while idx >= 0:
+        end = idx + len(marker)
+        if idx == 0 or content[idx - 1] == "\n":
+            next_char = content[end] if end < end_of_content else "\n"
+            if next_char.isspace() or (
+                next_char == "." and not (end + 1 < end_of_content and content[end + 1].isdigit())
+            ):
+                return f"{content[:idx]}- [x] {task_id}{content[end:]}"
+        idx = content.find(marker, end)
+
+    return None
+
+
+# Human-readable execution mode descriptions
+_MODE_DESCRIPTIONS = {
+    ExecutionMode.AUTOMATIC: "Automatic (runs without interruption)",
+    ExecutionMode.INTERACTIVE: "Interactive (prompts for each task)",
+}
+
+# Success-rate color thresholds for the summary, checked in order; anything lower is red
+_SUCCESS_RATE_COLORS = ((0.8, "green"), (0.5, "yellow"))
+
+# SDK tools that write to the project
+_SDK_FILE_TOOLS = frozenset({'Write', 'Edit', 'MultiEdit', 'NotebookEdit'})
+
+
+def _on_sdk_error(message: Any, console: Console) -> str:
+    """Report an SDK error message; the task stops."""
+    console.print(f"[red]❌ SDK Error: {getattr(message, 'content', None)}[/red]")
+    return "error"
+
+
+def _on_sdk_thinking(_message: Any, console: Console) -> None:
+    """Report that Claude is thinking."""
+    console.print(_MSG_SDK_THINKING)
+
+
+def _on_sdk_tool_use(message: Any, console: Console) -> str | None:
+    """Report a tool call and flag tools that write files."""
+    tool_name = getattr(message, 'tool_name', None)
+    if tool_name is None:
+        return None
+
+    console.print(Text.assemble("🔧 Using tool: ", str(tool_name), style="blue"))
+    if tool_name in _SDK_FILE_TOOLS:
+        console.print(Text.assemble("📝 File operation detected: ", tool_name, style="cyan"))
+        return "file_operation"
+    return None
+
+
+# SDK message handlers keyed by message type; each returns an optional outcome.
+# Errors are always printed; progress chatter goes to a quiet console unless verbose.
+_SDK_MESSAGE_HANDLERS: dict[str, Callable[[Any, Console], str | None]] = {
+    "error": _on_sdk_error,
+    "thinking": _on_sdk_thinking,
+    "tool_use": _on_sdk_tool_use,
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _get_quiet_console() -> Console:
+    """Create the console that swallows SDK progress output in non-verbose runs.
+    
+    Returns:
+        Console with output suppressed
+    """
+    return Console(quiet=True)
+
+
+# Static console messages, parsed from markup once at import time
+_MSG_SELECTION_EXAMPLES = Text.from_markup(
+    "[yellow]💡 Task selection format examples:[/yellow]\n"
+    "[dim]  --tasks all          # Execute all tasks[/dim]\n"
+    "[dim]  --tasks 1-3          # Execute tasks 1, 2, 3[/dim]\n"
+    "[dim]  --tasks 2,4,6        # Execute specific tasks[/dim]\n"
+    "[dim]  --tasks 1,3-5        # Mixed selection[/dim]\n"
+    "[dim]  --tasks 2.1-2.3      # Subtask range[/dim]"
+)
+_MSG_INTERACTIVE_NOTES = Text.from_markup(
+    "[dim]• You will be prompted before each task execution[/dim]\n"
+    "[dim]• Failed tasks will offer retry/skip/abort options[/dim]"
+)
+_MSG_CONTINUE_ON_ERROR_NOTE = Text.from_markup(
+    "[dim]• Failed tasks will be skipped automatically (continue-on-error enabled)[/dim]"
+)
+_MSG_STOP_ON_ERROR_NOTE = Text.from_markup(
+    "[dim]• Execution will stop on first failure (continue-on-error disabled)[/dim]"
+)
+_MSG_SDK_THINKING = Text.from_markup("[dim]🤔 Claude is thinking...[/dim]")
+_MSG_NO_BACKEND = Text.from_markup(
+    "[yellow]⚠️ Neither the Claude Code SDK nor the Claude executable was found; the task is likely to fail[/yellow]"
+)
+_MSG_EXECUTION_ABORTED = Text.from_markup("[red]❌ Execution aborted by user[/red]")
+_MSG_RESUME_HEADER = Text.from_markup("[bold yellow]🔄 Found Previous Auto-Run Session[/bold yellow]")
+_MSG_RESUME_OPTIONS = Text(
+    "Options:\n"
+    "  r - Resume from where it left off\n"
+    "  f - Start fresh (discard previous progress)\n"
+    "  c - Cancel auto-run"
+)
 
 
 class TaskAutoRunner:
@@ -75,6 +579,30 @@ class TaskAutoRunner:
         self.progress_manager = ProgressManager(self.console)
         self.current_execution_state: ExecutionState | None = None
 
+        # Debounced state persistence: coalesce checkpoint writes
+        self._state_dirty = False
+        self._last_flush = 0.0
+        self._min_flush_interval = 1.0
+        self._state_lock = asyncio.Lock()
+        self._trailing_flush: asyncio.TimerHandle | None = None
+        self._trailing_flush_task: asyncio.Task[None] | None = None
+
+        # Task IDs waiting to be checked off in tasks.md in one rewrite
+        self._pending_completions: set[str] = set()
+
+        # Last tasks.md content seen per path with the (mtime_ns, size) it had
+        self._tasks_md_cache: dict[Path, tuple[int, int, str]] = {}
+
+        # State file paths per spec name, resolved against the cwd on first use
+        self._state_file_paths: dict[str, Path] = {}
+
+        # Content hash (ignoring last_updated) of the last state written, keyed with its spec name
+        self._last_payload_hash: tuple[str, int] | None = None
+
+        # Background checkpoint writer, active for the duration of run_all_tasks
+        self._state_queue: asyncio.Queue[tuple[str, bytes, int] | None] | None = None
+        self._writer_task: asyncio.Task[None] | None = None
+
     def _get_state_file_path(self, spec_name: str) -> Path:
         """Get the file path for execution state persistence.
         
@@ -84,7 +612,11 @@ class TaskAutoRunner:
         Returns:
             Path to the state file
         """
-        return Path.cwd() / ".claude" / "specs" / spec_name / ".auto_run_state.json"
+        state_file = self._state_file_paths.get(spec_name)
+        if state_file is None:
+            state_file = Path.cwd() / ".claude" / "specs" / spec_name / ".auto_run_state.json"
+            self._state_file_paths[spec_name] = state_file
+        return state_file
 
     async def _save_execution_state(self, state: ExecutionState) -> None:
         """Save the execution state to file for recovery purposes.
@@ -95,16 +627,180 @@ class TaskAutoRunner:
             state: ExecutionState to save
         """
         try:
-            state_file = self._get_state_file_path(state.spec_name)
-            state_data = state.to_dict()
+            payload, content_hash = _serialize_state(state)
+        except Exception as e:
+            self.console.print(f"[yellow]⚠️ Warning: Could not save execution state: {e}[/yellow]")
+            return
+
+        await self._write_state_payload(state.spec_name, payload, content_hash)
+
+    async def _write_state_payload(self, spec_name: str, payload: bytes, content_hash: int) -> None:
+        """Write an already serialized execution state to its state file.
+        
+        Args:
+            spec_name: Name of the specification
+            payload: JSON-encoded execution state
+            content_hash: Hash of the state without its last_updated stamp
+        """
+        # Skip the write when only last_updated changed since the last one
+        payload_hash = (spec_name, content_hash)
+        if payload_hash == self._last_payload_hash:
+            return
 
-            async with aiofiles.open(state_file, 'w', encoding='utf-8') as f:
-                await f.write(json.dumps(state_data, indent=2))
+        try:
+            # Write to a temporary file and rename over the state file so a crash
+            # mid-write never leaves truncated JSON behind
+            state_file = self._get_state_file_path(spec_name)
+            tmp_file = state_file.with_suffix('.json.tmp')
+            await asyncio.to_thread(tmp_file.write_bytes, payload)
+            await asyncio.to_thread(os.replace, tmp_file, state_file)
+            self._last_payload_hash = payload_hash
 
         except Exception as e:
             # Don't fail the execution if state saving fails, just log it
             self.console.print(f"[yellow]⚠️ Warning: Could not save execution state: {e}[/yellow]")
 
+    def _start_state_writer(self) -> None:
+        """Start the background task that persists queued state snapshots."""
+        if self._writer_task is None:
+            self._state_queue = asyncio.Queue(maxsize=4)
+            self._writer_task = asyncio.create_task(self._state_writer_loop(self._state_queue))
+
+    async def _stop_state_writer(self) -> None:
+        """Flush queued snapshots and stop the background writer."""
+        if self._writer_task is None or self._state_queue is None:
+            return
+
+        # Hand a coalesced update still waiting on its trailing flush to the writer
+        self._cancel_trailing_flush()
+        if self._state_dirty and self.current_execution_state is not None:
+            self._state_dirty = False
+            self._last_flush = time.time()
+            self._enqueue_state_snapshot(self.current_execution_state)
+
+        await self._state_queue.put(None)
+        await self._writer_task
+        self._writer_task = None
+        self._state_queue = None
+
+    async def _state_writer_loop(self, queue: asyncio.Queue[tuple[str, bytes, int] | None]) -> None:
+        """Write state snapshots from the queue, keeping only the latest of a burst.
+        
+        Args:
+            queue: Queue of (spec_name, payload, content_hash) snapshots; None stops the loop
+        """
+        while True:
+            latest = await queue.get()
+            received = 1
+            stop = latest is None
+
+            # Coalesce everything that queued up while the last write ran
+            while not queue.empty():
+                item = queue.get_nowait()
+                received += 1
+                if item is None:
+                    stop = True
+                else:
+                    latest = item
+
+            if latest is not None:
+                await self._write_state_payload(*latest)
+
+            for _ in range(received):
+                queue.task_done()
+
+            if stop:
+                return
+
+    def _enqueue_state_snapshot(self, state: ExecutionState) -> None:
+        """Queue a state snapshot for the background writer, dropping the oldest if full.
+        
+        Args:
+            state: ExecutionState to snapshot
+        """
+        queue = self._state_queue
+        if queue is None:
+            return
+
+        snapshot = (state.spec_name, *_serialize_state(state))
+        if queue.full():
+            queue.get_nowait()
+            queue.task_done()
+        queue.put_nowait(snapshot)
+
+    async def _request_state_save(self, state: ExecutionState) -> None:
+        """Mark the execution state dirty and save it if the flush interval has elapsed.
+        
+        Updates arriving within ``_min_flush_interval`` of the last write are
+        coalesced and written by a trailing flush once the interval has passed,
+        unless an explicit ``_flush_state_now`` gets there first. While the
+        background writer is running the snapshot is queued instead of written
+        inline.
+        
+        Args:
+            state: ExecutionState to save
+        """
+        self._state_dirty = True
+        elapsed = time.time() - self._last_flush
+        if elapsed <= self._min_flush_interval:
+            if self._trailing_flush is None:
+                loop = asyncio.get_running_loop()
+                self._trailing_flush = loop.call_later(
+                    self._min_flush_interval - elapsed, self._flush_pending_state, state
+                )
+            return
+
+        self._cancel_trailing_flush()
+        if self._state_queue is not None:
+            self._state_dirty = False
+            self._last_flush = time.time()
+            self._enqueue_state_snapshot(state)
+        else:
+            await self._flush_state_now(state)
+
+    def _flush_pending_state(self, state: ExecutionState) -> None:
+        """Write a state update that was coalesced by ``_request_state_save``.
+        
+        Args:
+            state: ExecutionState to save
+        """
+        self._trailing_flush = None
+        if not self._state_dirty:
+            return
+
+        if self._state_queue is not None:
+            self._state_dirty = False
+            self._last_flush = time.time()
+            self._enqueue_state_snapshot(state)
+        else:
+            self._trailing_flush_task = asyncio.create_task(self._flush_state_now(state))
+
+    def _cancel_trailing_flush(self) -> None:
+        """Cancel a scheduled trailing flush, if any."""
+        if self._trailing_flush is not None:
+            self._trailing_flush.cancel()
+            self._trailing_flush = None
+
+    async def _flush_state_now(self, state: ExecutionState) -> None:
+        """Write the execution state to disk immediately.
+        
+        Used on interruption, failure, and abort so the latest state is never lost.
+        When the background writer is running, waits until it has written the
+        snapshot.
+        
+        Args:
+            state: ExecutionState to save
+        """
+        self._cancel_trailing_flush()
+        async with self._state_lock:
+            self._state_dirty = False
+            self._last_flush = time.time()
+            if self._state_queue is not None:
+                self._enqueue_state_snapshot(state)
+                await self._state_queue.join()
+            else:
+                await self._save_execution_state(state)
+
     async def _load_execution_state(self, spec_name: str) -> ExecutionState | None:
         """Load execution state from a file for recovery.
         
@@ -119,13 +815,13 @@ class TaskAutoRunner:
             if not state_file.exists():
                 return None
 
-            async with aiofiles.open(state_file, encoding='utf-8') as f:
-                content = await f.read()
-                state_data = json.loads(content)
+            content = await asyncio.to_thread(state_file.read_bytes)
+            state_data = _loads_state(content)
 
             return ExecutionState.from_dict(state_data)
 
-        except (json.JSONDecodeError, KeyError, ValueError) as e:
+        except (KeyError, ValueError) as e:
+            # Decode errors from json and orjson are both ValueError subclasses
             self.console.print(f"[yellow]⚠️ Warning: Invalid execution state file: {e}[/yellow]")
             return None
         except Exception as e:
@@ -139,6 +835,10 @@ class TaskAutoRunner:
         Args:
             spec_name: Name of the specification
         """
+        # Discard any pending write so the file is not recreated later
+        self._cancel_trailing_flush()
+        self._state_dirty = False
+        self._last_payload_hash = None
         try:
             state_file = self._get_state_file_path(spec_name)
             if state_file.exists():
@@ -158,29 +858,16 @@ class TaskAutoRunner:
         if self.current_execution_state is None:
             return
 
-        # Clean up previous entries for this task (handles retries)
-        task_id = task_result.task_id
-        if task_id in self.current_execution_state.completed_task_ids:
-            self.current_execution_state.completed_task_ids.remove(task_id)
-        if task_id in self.current_execution_state.failed_task_ids:
-            self.current_execution_state.failed_task_ids.remove(task_id)
-        if task_id in self.current_execution_state.skipped_task_ids:
-            self.current_execution_state.skipped_task_ids.remove(task_id)
-
-        # Update state based on the current task result
-        if task_result.status == TaskStatus.SUCCESS:
-            self.current_execution_state.completed_task_ids.append(task_result.task_id)
-        elif task_result.status == TaskStatus.FAILED:
-            self.current_execution_state.failed_task_ids.append(task_result.task_id)
-        elif task_result.status == TaskStatus.SKIPPED:
-            self.current_execution_state.skipped_task_ids.append(task_result.task_id)
-
-        # Update timestamps and the current task
-        self.current_execution_state.last_updated = time.time()
+        # Record the outcome, replacing previous entries for this task (handles retries)
+        self.current_execution_state.record_task_result(task_result.task_id, task_result.status)
+
+        # Update timestamps (reusing the task's completion time) and the current task
+        end_time = task_result.end_time
+        self.current_execution_state.last_updated = end_time if end_time is not None else time.time()
         self.current_execution_state.current_task_id = None  # Task completed
 
         # Save an updated state
-        await self._save_execution_state(self.current_execution_state)
+        await self._request_state_save(self.current_execution_state)
 
     async def check_for_resumable_execution(self, spec_name: str) -> ExecutionState | None:
         """Check if there's a resumable execution for the given spec.
@@ -213,8 +900,8 @@ class TaskAutoRunner:
             True if the user wants to resume, False to start fresh
         """
         self.console.print()
-        self.console.print("[bold yellow]🔄 Found Previous Auto-Run Session[/bold yellow]")
-        self.console.print(f"[blue]Spec: {saved_state.spec_name}[/blue]")
+        self.console.print(_MSG_RESUME_HEADER)
+        self.console.print(Text.assemble("Spec: ", saved_state.spec_name, style="blue"))
         self.console.print(f"[dim]Started: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(saved_state.start_time))}[/dim]")
         self.console.print(f"[dim]Progress: {len(saved_state.completed_task_ids)}/{saved_state.total_tasks} tasks completed ({saved_state.completion_rate:.0%})[/dim]")
 
@@ -227,7 +914,8 @@ class TaskAutoRunner:
         self.console.print()
 
         # Use inquirer for enhanced user experience when available
-        if INQUIRER_AVAILABLE:
+        inquirer = _get_inquirer()
+        if inquirer is not None:
             questions = [
                 inquirer.List('action',
                             message='Resume previous execution or start fresh?',
@@ -238,20 +926,18 @@ class TaskAutoRunner:
                             ],
                             default='resume')
             ]
-            answers = inquirer.prompt(questions)
+            # Prompt in a worker thread so the event loop keeps running
+            answers = await asyncio.to_thread(inquirer.prompt, questions)
             if not answers or answers['action'] == 'cancel':
                 return False
 
             return answers['action'] == 'resume'
         else:
             # Fallback to basic input
-            self.console.print("Options:")
-            self.console.print("  r - Resume from where it left off")
-            self.console.print("  f - Start fresh (discard previous progress)")
-            self.console.print("  c - Cancel auto-run")
+            self.console.print(_MSG_RESUME_OPTIONS)
 
             while True:
-                choice = input("Action (r/f/c): ").lower().strip()
+                choice = (await asyncio.to_thread(_read_choice, "Action (r/f/c): ")).lower().strip()
                 if choice in ['r', 'resume']:
                     return True
                 elif choice in ['f', 'fresh'] or choice in ['c', 'cancel']:
@@ -259,7 +945,14 @@ class TaskAutoRunner:
                 else:
                     print("Please enter 'r', 'f', or 'c'")
 
-    async def run_all_tasks(self, spec_name: str, options: AutoRunOptions) -> AutoRunResult:
+    async def run_all_tasks(
+        self,
+        spec_name: str,
+        options: AutoRunOptions,
+        spec_context: SpecContext | None = None,
+        *,
+        preparsed_tasks: list[ParsedTask] | None = None,
+    ) -> AutoRunResult:
         """Execute all tasks in a specification sequentially.
         
         This is the main orchestration method that coordinates task parsing,
@@ -268,22 +961,26 @@ class TaskAutoRunner:
         Args:
             spec_name: Name of the specification to execute
             options: Configuration options for execution
+            spec_context: Already loaded context for spec_name; loaded from disk when omitted
+            preparsed_tasks: Tasks the caller already parsed from this spec's tasks.md,
+                used instead of parsing it again when the context is loaded
             
         Returns:
             AutoRunResult with comprehensive execution summary
         """
         self.console.print(f"[bold cyan]🚀 Starting auto-run for specification: {spec_name}[/bold cyan]")
 
-        # Load spec context
-        try:
-            spec_context = await self._load_spec_context(spec_name)
-            self.console.print("[green]✓ Loaded specification context[/green]")
-        except Exception as e:
-            self.console.print(f"[red]✗ Failed to load specification: {e}[/red]")
-            raise
+        # Load spec context unless the caller already has it
+        if spec_context is None:
+            try:
+                spec_context = await self._load_spec_context(spec_name, preparsed_tasks)
+                self.console.print("[green]✓ Loaded specification context[/green]")
+            except Exception as e:
+                self.console.print(f"[red]✗ Failed to load specification: {e}[/red]")
+                raise
 
         # Parse tasks from tasks.md leveraging existing parse_tasks_from_markdown
-        parsed_tasks = parse_tasks_from_markdown(spec_context.tasks_content)
+        parsed_tasks = _get_parsed_tasks(spec_context)
         self.console.print(f"[blue]📋 Parsed {len(parsed_tasks)} tasks from tasks.md[/blue]")
 
         if not parsed_tasks:
@@ -292,16 +989,13 @@ class TaskAutoRunner:
 
         # Filter tasks based on selection with enhanced error handling per Requirement 2.1
         try:
-            selected_tasks = self._filter_tasks(parsed_tasks, options.task_selection)
+            selected_tasks = self._filter_tasks(
+                parsed_tasks, options.task_selection, explicit_task_ids=options.explicit_task_ids
+            )
         except ValueError as e:
             self.console.print(f"[red]❌ Task selection error: {e}[/red]")
             self.console.print()
-            self.console.print("[yellow]💡 Task selection format examples:[/yellow]")
-            self.console.print("[dim]  --tasks all          # Execute all tasks[/dim]")
-            self.console.print("[dim]  --tasks 1-3          # Execute tasks 1, 2, 3[/dim]")
-            self.console.print("[dim]  --tasks 2,4,6        # Execute specific tasks[/dim]")
-            self.console.print("[dim]  --tasks 1,3-5        # Mixed selection[/dim]")
-            self.console.print("[dim]  --tasks 2.1-2.3      # Subtask range[/dim]")
+            self.console.print(_MSG_SELECTION_EXAMPLES)
             self.console.print()
             raise ValueError(f"Invalid task selection: {e}")
 
@@ -311,18 +1005,20 @@ class TaskAutoRunner:
 
         self.console.print(f"[blue]🎯 Selected {len(selected_tasks)} tasks for execution[/blue]")
 
+        # Per-message SDK chatter only when detailed progress is wanted on a terminal
+        self.task_executor.verbose = options.show_detailed_progress and self.console.is_terminal
+
         # Log execution mode with enhanced descriptions per Requirement 2.2
         mode_text = self._get_execution_mode_description(options.execution_mode)
         self.console.print(f"[dim]Execution mode: {mode_text}[/dim]")
 
         # Show additional mode-specific information
         if options.execution_mode == ExecutionMode.INTERACTIVE:
-            self.console.print("[dim]• You will be prompted before each task execution[/dim]")
-            self.console.print("[dim]• Failed tasks will offer retry/skip/abort options[/dim]")
+            self.console.print(_MSG_INTERACTIVE_NOTES)
         elif options.continue_on_error:
-            self.console.print("[dim]• Failed tasks will be skipped automatically (continue-on-error enabled)[/dim]")
+            self.console.print(_MSG_CONTINUE_ON_ERROR_NOTE)
         else:
-            self.console.print("[dim]• Execution will stop on first failure (continue-on-error disabled)[/dim]")
+            self.console.print(_MSG_STOP_ON_ERROR_NOTE)
 
         # Initialize execution state for persistence per Requirement 2.3
         self.current_execution_state = ExecutionState(
@@ -334,23 +1030,36 @@ class TaskAutoRunner:
         )
 
         # Save the initial state
-        await self._save_execution_state(self.current_execution_state)
+        await self._flush_state_now(self.current_execution_state)
 
         # Initialize result tracking
         result = AutoRunResult(
             spec_name=spec_name,
-            total_tasks=len(selected_tasks)
+            total_tasks=len(selected_tasks),
+            start_time=time.time()
         )
 
+        # Persist checkpoints off the critical path while tasks run
+        self._start_state_writer()
+
         # Create a progress display with exception handling for interruptions
         try:
             with self.progress_manager.create_progress_display(len(selected_tasks)) as progress:
                 # Execute tasks sequentially with enhanced execution control per Requirements 2.2
                 for task in selected_tasks:
+                    warmup: asyncio.Task[bool] | None = None
+
                     # Interactive mode: prompt for confirmation before each task
                     if options.execution_mode == ExecutionMode.INTERACTIVE:
-                        should_execute = await self._prompt_task_confirmation(task)
+                        # Prepare the execution backend while the user decides
+                        warmup = asyncio.create_task(self.task_executor.warm_up())
+                        try:
+                            should_execute = await self._prompt_task_confirmation(task)
+                        except BaseException:
+                            warmup.cancel()
+                            raise
                         if not should_execute:
+                            warmup.cancel()
                             # Skip this task
                             skipped_result = TaskResult(
                                 task_id=task.id,
@@ -364,9 +1073,13 @@ class TaskAutoRunner:
                             )
                             continue
 
+                    # Wait for the warm-up so it never outlives the task it prepared
+                    if warmup is not None and not await warmup:
+                        self.console.print(_MSG_NO_BACKEND)
+
                     # Update current task in execution state
                     self.current_execution_state.current_task_id = task.id
-                    await self._save_execution_state(self.current_execution_state)
+                    await self._request_state_save(self.current_execution_state)
 
                     # Execute the task
                     task_result = await self._execute_single_task(
@@ -385,7 +1098,7 @@ class TaskAutoRunner:
                                 action = await self._prompt_failure_action(task_result)
                                 if action == "retry":
                                     # Retry the task
-                                    self.console.print(f"[yellow]🔄 Retrying task {task.id}...[/yellow]")
+                                    self.console.print(Text.assemble("🔄 Retrying task ", task.id, "...", style="yellow"))
                                     retry_result = await self._execute_single_task(
                                         task, spec_context, options, progress
                                     )
@@ -400,21 +1113,25 @@ class TaskAutoRunner:
                                     # Skip and continue to the next task
                                     break
                                 elif action == "abort":
-                                    self.console.print("[red]❌ Execution aborted by user[/red]")
+                                    self.console.print(_MSG_EXECUTION_ABORTED)
+                                    await self._flush_state_now(self.current_execution_state)
+                                    result.finalize()
                                     return result
                         # Automatic mode: handle based on the continue_on_error setting
                         elif not options.continue_on_error:
-                            self.console.print(f"[red]❌ Task {task.id} failed. Stopping execution.[/red]")
+                            self.console.print(Text.assemble("❌ Task ", task.id, " failed. Stopping execution.", style="red"))
                             break
                         else:
-                            self.console.print(f"[yellow]⚠️ Task {task.id} failed. Continuing due to --continue-on-error flag.[/yellow]")
+                            self.console.print(Text.assemble(
+                                "⚠️ Task ", task.id, " failed. Continuing due to --continue-on-error flag.", style="yellow"
+                            ))
 
         except KeyboardInterrupt:
             # Handle Ctrl+C interruption gracefully per Requirement 2.3
             self.console.print("\n[yellow]⚠️ Auto-run interrupted by user[/yellow]")
             if self.current_execution_state:
                 self.current_execution_state.interruption_reason = "Interrupted by user (Ctrl+C)"
-                await self._save_execution_state(self.current_execution_state)
+                await self._flush_state_now(self.current_execution_state)
             self.console.print("[blue]💾 Execution state saved. You can resume later with --resume-from option.[/blue]")
             raise
         except Exception as e:
@@ -422,8 +1139,11 @@ class TaskAutoRunner:
             self.console.print(f"[red]💥 Unexpected error during execution: {e}[/red]")
             if self.current_execution_state:
                 self.current_execution_state.interruption_reason = f"Unexpected error: {e!s}"
-                await self._save_execution_state(self.current_execution_state)
+                await self._flush_state_now(self.current_execution_state)
             raise
+        finally:
+            await self._flush_completions(spec_context)
+            await self._stop_state_writer()
 
         result.finalize()
 
@@ -433,7 +1153,7 @@ class TaskAutoRunner:
         # Mark interruption reason in state if execution was incomplete
         elif self.current_execution_state:
             self.current_execution_state.interruption_reason = "Execution stopped due to failures"
-            await self._save_execution_state(self.current_execution_state)
+            await self._flush_state_now(self.current_execution_state)
 
         # Enhanced completion reporting per Requirement 1.3
         self.progress_manager.report_completion_summary(result)
@@ -450,35 +1170,50 @@ class TaskAutoRunner:
         Args:
             result: AutoRunResult containing execution details
         """
-        failed_results = [r for r in result.task_results if r.status == TaskStatus.FAILED]
+        failed_results = result.results_with_status(TaskStatus.FAILED)
 
         if not failed_results:
             return
 
-        self.console.print()
-        self.console.print("[bold red]📋 Failure Summary[/bold red]")
-        self.console.print(f"[red]{len(failed_results)} task(s) failed during execution:[/red]")
-        self.console.print()
-
-        for i, task_result in enumerate(failed_results, 1):
-            self.console.print(f"[red]{i}. Task {task_result.task_id}: {task_result.task_description}[/red]")
-            self.console.print(f"[dim]   Error: {task_result.error_message}[/dim]")
-            self.console.print(f"[dim]   Time: {task_result.execution_time:.2f}s[/dim]")
+        lines: list[Text] = [
+            Text(),
+            Text.from_markup("[bold red]📋 Failure Summary[/bold red]"),
+            Text.from_markup(f"[red]{len(failed_results)} task(s) failed during execution:[/red]"),
+            Text(),
+        ]
 
-        self.console.print()
-        self.console.print("[yellow]💡 Actionable guidance:[/yellow]")
-        self.console.print("[dim]• Review the error messages above for specific failure reasons[/dim]")
-        self.console.print("[dim]• Use interactive mode (--mode interactive) for step-by-step control[/dim]")
-        self.console.print("[dim]• Use --continue-on-error to skip failed tasks and continue[/dim]")
-        self.console.print("[dim]• Resume from specific task with --resume-from <task-id>[/dim]")
+        if len(failed_results) > 50:
+            # Large failure lists are rendered as one plain block rather than
+            # three styled lines per task.
+            lines.append(Text("\n".join(
+                f"{i}. Task {r.task_id}: {r.task_description}\n"
+                f"   Error: {r.error_message}\n"
+                f"   Time: {r.execution_time:.2f}s"
+                for i, r in enumerate(failed_results, 1)
+            ), style="red"))
+        else:
+            for i, task_result in enumerate(failed_results, 1):
+                lines.append(Text.from_markup(f"[red]{i}. Task {task_result.task_id}: {task_result.task_description}[/red]"))
+                lines.append(Text.from_markup(f"[dim]   Error: {task_result.error_message}[/dim]"))
+                lines.append(Text.from_markup(f"[dim]   Time: {task_result.execution_time:.2f}s[/dim]"))
+
+        lines.extend((
+            Text(),
+            Text.from_markup("[yellow]💡 Actionable guidance:[/yellow]"),
+            Text.from_markup("[dim]• Review the error messages above for specific failure reasons[/dim]"),
+            Text.from_markup("[dim]• Use interactive mode (--mode interactive) for step-by-step control[/dim]"),
+            Text.from_markup("[dim]• Use --continue-on-error to skip failed tasks and continue[/dim]"),
+            Text.from_markup("[dim]• Resume from specific task with --resume-from <task-id>[/dim]"),
+        ))
 
         # Show which tasks were successful for context
-        successful_results = [r for r in result.task_results if r.status == TaskStatus.SUCCESS]
-        if successful_results:
-            self.console.print()
-            self.console.print(f"[green]✅ {len(successful_results)} task(s) completed successfully:[/green]")
-            success_ids = [r.task_id for r in successful_results]
-            self.console.print(f"[dim]   {', '.join(success_ids)}[/dim]")
+        success_ids = [r.task_id for r in result.results_with_status(TaskStatus.SUCCESS)]
+        if success_ids:
+            lines.append(Text())
+            lines.append(Text.from_markup(f"[green]✅ {len(success_ids)} task(s) completed successfully:[/green]"))
+            lines.append(Text(f"   {', '.join(success_ids)}", style="dim"))
+
+        self.console.print(Group(*lines))
 
     async def run_task_range(self, spec_name: str, start_task: str, end_task: str) -> AutoRunResult:
         """Execute a range of tasks from start_task to end_task.
@@ -512,35 +1247,36 @@ class TaskAutoRunner:
         """
         # Load spec context to validate task exists
         spec_context = await self._load_spec_context(spec_name)
-        parsed_tasks = parse_tasks_from_markdown(spec_context.tasks_content)
+        parsed_tasks = _get_parsed_tasks(spec_context)
 
-        # Validate task_id exists using the enhanced validation logic
-        available_task_ids = {task.id for task in parsed_tasks}
-        if task_id not in available_task_ids:
-            available_ids_str = ", ".join(sorted(available_task_ids))
+        # Validate task_id exists and find the resume index in one pass
+        id_to_index: dict[str, int] = {}
+        for i, task in enumerate(parsed_tasks):
+            id_to_index.setdefault(task.id, i)
+
+        if task_id not in id_to_index:
+            available_ids_str = ", ".join(sorted(id_to_index))
             raise ValueError(
                 f"Task ID '{task_id}' not found in specification '{spec_name}'. "
                 f"Available task IDs: {available_ids_str}"
             )
 
-        # Find the resume index
-        resume_index = next(i for i, task in enumerate(parsed_tasks) if task.id == task_id)
+        resume_index = id_to_index[task_id]
 
         self.console.print(f"[cyan]🔄 Resuming execution from task {task_id}[/cyan]")
 
-        # Create selection string for remaining tasks
+        # Collect the remaining task IDs (already validated against parsed_tasks)
         remaining_task_ids = [task.id for task in parsed_tasks[resume_index:]]
-        task_selection = ",".join(remaining_task_ids)
 
         # Update options with the remaining tasks selection
         resume_options = AutoRunOptions(
             execution_mode=options.execution_mode,
-            task_selection=task_selection,
+            explicit_task_ids=remaining_task_ids,
             continue_on_error=options.continue_on_error,
             show_detailed_progress=options.show_detailed_progress,
             resume_from_task=task_id
         )
-        return await self.run_all_tasks(spec_name, resume_options)
+        return await self.run_all_tasks(spec_name, resume_options, spec_context=spec_context)
 
     async def resume_from_saved_state(self, saved_state: ExecutionState) -> AutoRunResult:
         """Resume execution from a saved state.
@@ -559,23 +1295,23 @@ class TaskAutoRunner:
 
         # Load spec context to get the current task list
         spec_context = await self._load_spec_context(saved_state.spec_name)
-        parsed_tasks = parse_tasks_from_markdown(spec_context.tasks_content)
+        parsed_tasks = _get_parsed_tasks(spec_context)
 
         # Find tasks that need to be executed (not completed or skipped)
-        completed_and_skipped = set(saved_state.completed_task_ids + saved_state.skipped_task_ids)
-        remaining_tasks = [task for task in parsed_tasks if task.id not in completed_and_skipped]
+        remaining_tasks = [task for task in parsed_tasks if not saved_state.is_task_done(task.id)]
 
         if not remaining_tasks:
             self.console.print("[green]✅ All tasks already completed![/green]")
             # Clear the state file since everything is done
             await self._clear_execution_state(saved_state.spec_name)
-            return AutoRunResult(
+            completed_result = AutoRunResult(
                 spec_name=saved_state.spec_name,
                 total_tasks=len(parsed_tasks),
-                executed_tasks=len(saved_state.completed_task_ids),
-                successful_tasks=len(saved_state.completed_task_ids),
                 summary_message="All tasks were already completed"
             )
+            completed_result.executed_tasks = len(saved_state.completed_task_ids)
+            completed_result.successful_tasks = len(saved_state.completed_task_ids)
+            return completed_result
 
         self.console.print(f"[blue]📋 {len(remaining_tasks)} tasks remaining to execute[/blue]")
 
@@ -583,48 +1319,49 @@ class TaskAutoRunner:
         remaining_task_ids = [task.id for task in remaining_tasks]
         resume_options = AutoRunOptions(
             execution_mode=saved_state.options.execution_mode,
-            task_selection=",".join(remaining_task_ids),
+            explicit_task_ids=remaining_task_ids,
             continue_on_error=saved_state.options.continue_on_error,
             show_detailed_progress=saved_state.options.show_detailed_progress,
             resume_from_task=remaining_task_ids[0] if remaining_task_ids else None
         )
 
-        return await self.run_all_tasks(saved_state.spec_name, resume_options)
+        return await self.run_all_tasks(saved_state.spec_name, resume_options, spec_context=spec_context)
 
-    async def _load_spec_context(self, spec_name: str) -> SpecContext:
+    async def _load_spec_context(
+        self, spec_name: str, parsed_tasks: list[ParsedTask] | None = None
+    ) -> SpecContext:
         """Load all specification documents and context.
         
         Args:
             spec_name: Name of the specification to load
+            parsed_tasks: Tasks already parsed from the spec's tasks.md, if available
             
         Returns:
             SpecContext with all loaded documents
         """
         spec_dir = Path.cwd() / ".claude" / "specs" / spec_name
 
-        # Load main spec documents
-        requirements_path = spec_dir / "requirements.md"
-        design_path = spec_dir / "design.md"
-        tasks_path = spec_dir / "tasks.md"
-
-        async with aiofiles.open(requirements_path, encoding='utf-8') as f:
-            requirements_content = await f.read()
-
-        async with aiofiles.open(design_path, encoding='utf-8') as f:
-            design_content = await f.read()
-
-        async with aiofiles.open(tasks_path, encoding='utf-8') as f:
-            tasks_content = await f.read()
-
-        # Load steering documents if available
-        steering_documents = {}
+        # Main spec documents and any available steering documents
         steering_dir = Path.cwd() / ".claude" / "steering"
+        main_paths = [spec_dir / "requirements.md", spec_dir / "design.md", spec_dir / "tasks.md"]
+        candidates = [(name, steering_dir / name) for name in ("product.md", "tech.md", "structure.md")]
 
-        for steering_file in ["product.md", "tech.md", "structure.md"]:
-            steering_path = steering_dir / steering_file
-            if steering_path.exists():
-                async with aiofiles.open(steering_path, encoding='utf-8') as f:
-                    steering_documents[steering_file] = await f.read()
+        existence = await asyncio.gather(*(asyncio.to_thread(path.exists) for _, path in candidates))
+        steering_candidates = [
+            (name, path) for (name, path), exists in zip(candidates, existence) if exists
+        ]
+
+        # Read everything in a single round-trip
+        contents = await asyncio.gather(
+            *(
+                asyncio.to_thread(path.read_text, encoding='utf-8')
+                for path in [*main_paths, *(path for _, path in steering_candidates)]
+            )
+        )
+        requirements_content, design_content, tasks_content = contents[:3]
+        steering_documents = {
+            name: content for (name, _), content in zip(steering_candidates, contents[3:])
+        }
 
         return SpecContext(
             spec_name=spec_name,
@@ -632,10 +1369,16 @@ class TaskAutoRunner:
             design_content=design_content,
             tasks_content=tasks_content,
             steering_documents=steering_documents,
-            spec_directory=spec_dir
+            spec_directory=spec_dir,
+            parsed_tasks=parsed_tasks if parsed_tasks is not None else parse_tasks_from_markdown(tasks_content)
         )
 
-    def _filter_tasks(self, tasks: list[ParsedTask], selection: str | None) -> list[ParsedTask]:
+    def _filter_tasks(
+        self,
+        tasks: list[ParsedTask],
+        selection: str | None,
+        explicit_task_ids: list[str] | None = None
+    ) -> list[ParsedTask]:
         """Filter tasks based on selection criteria.
         
         Enhanced implementation that supports hierarchical task numbering and provides
@@ -651,6 +1394,8 @@ class TaskAutoRunner:
         Args:
             tasks: List of all parsed tasks
             selection: Selection criteria
+            explicit_task_ids: Already validated task IDs (e.g. from a resume);
+                when given, the selection string is not parsed
             
         Returns:
             Filtered list of tasks to execute in hierarchical order
@@ -658,7 +1403,12 @@ class TaskAutoRunner:
         Raises:
             ValueError: If a selection format is invalid or contains non-existent task IDs
         """
-        if not selection or selection.lower() in ["all", "*"]:
+        if explicit_task_ids is not None:
+            explicit_ids = set(explicit_task_ids)
+            return self._sort_tasks_hierarchically([task for task in tasks if task.id in explicit_ids])
+
+        # Default "run everything" selection skips parsing and validation
+        if not selection or selection == "all" or selection.lower() in ("all", "*"):
             return self._sort_tasks_hierarchically(tasks)
 
         # Validate a selection format and parse task IDs
@@ -668,19 +1418,20 @@ class TaskAutoRunner:
             raise ValueError(f"Invalid task selection format: {e}")
 
         # Validate that all selected task IDs exist
-        available_task_ids = {task.id for task in tasks}
-        invalid_ids = [task_id for task_id in selected_task_ids if task_id not in available_task_ids]
+        available_ids = {task.id for task in tasks}
+        invalid_ids = [task_id for task_id in selected_task_ids if task_id not in available_ids]
 
         if invalid_ids:
-            available_ids_str = ", ".join(sorted(available_task_ids))
+            available_ids_str = ", ".join(sorted(available_ids))
             invalid_ids_str = ", ".join(invalid_ids)
             raise ValueError(
                 f"Task IDs not found: {invalid_ids_str}. "
                 f"Available task IDs: {available_ids_str}"
             )
 
-        # Filter tasks based on validated selection
-        filtered = [t for t in tasks if t.id in selected_task_ids]
+        # Keep every matching task, in tasks.md order
+        selected_ids = set(selected_task_ids)
+        filtered = [task for task in tasks if task.id in selected_ids]
 
         if not filtered:
             raise ValueError(f"No tasks match selection criteria: {selection}")
@@ -704,7 +1455,13 @@ class TaskAutoRunner:
         if not selection or not selection.strip():
             raise ValueError("Selection cannot be empty")
 
+        task_ids = _parse_selection_fast(selection)
+        if task_ids is not None:
+            return task_ids
+
+        # Keep first occurrences only, in selection order
         task_ids = []
+        seen: set[str] = set()
 
         # Split by commas to handle mixed selections
         parts = [part.strip() for part in selection.split(",")]
@@ -726,17 +1483,23 @@ class TaskAutoRunner:
 
                 try:
                     range_ids = self._generate_task_range(start, end)
-                    task_ids.extend(range_ids)
                 except ValueError as e:
                     raise ValueError(f"Invalid range '{part}': {e}")
+
+                for task_id in range_ids:
+                    if task_id not in seen:
+                        seen.add(task_id)
+                        task_ids.append(task_id)
             else:
                 # Single task ID
                 task_id = part.strip()
                 if not task_id:
                     raise ValueError("Empty task ID in selection")
-                task_ids.append(task_id)
+                if task_id not in seen:
+                    seen.add(task_id)
+                    task_ids.append(task_id)
 
-        return list(dict.fromkeys(task_ids))  # Remove duplicates while preserving order
+        return task_ids
 
     def _generate_task_range(self, start: str, end: str) -> list[str]:
         """Generate a list of task IDs within a range.
@@ -753,42 +1516,33 @@ class TaskAutoRunner:
         Raises:
             ValueError: If range is invalid
         """
-        try:
-            # Handle simple numeric ranges (e.g., "1-3")
-            if "." not in start and "." not in end:
-                start_num = int(start)
-                end_num = int(end)
-                if start_num > end_num:
-                    raise ValueError(f"Start ({start}) is greater than end ({end})")
-                return [str(i) for i in range(start_num, end_num + 1)]
-
-            # Handle hierarchical ranges (e.g., "2.1-2.3")
-            start_parts = [int(p) for p in start.split(".")]
-            end_parts = [int(p) for p in end.split(".")]
-
-            # Ensure the same hierarchy level
-            if len(start_parts) != len(end_parts):
-                raise ValueError(f"Hierarchy level mismatch between '{start}' and '{end}'")
-
-            # For subtask ranges, only the last part should vary
-            if len(start_parts) > 1:
-                if start_parts[:-1] != end_parts[:-1]:
-                    raise ValueError(f"Parent task mismatch between '{start}' and '{end}'")
-
-                if start_parts[-1] > end_parts[-1]:
-                    raise ValueError(f"Start subtask ({start}) is greater than end subtask ({end})")
-
-                # Generate subtask IDs
-                parent_prefix = ".".join(str(p) for p in start_parts[:-1])
-                return [f"{parent_prefix}.{i}" for i in range(start_parts[-1], end_parts[-1] + 1)]
-
-            # Should not reach here for valid hierarchical ranges
-            raise ValueError(f"Unsupported range format: '{start}-{end}'")
-
-        except (ValueError, IndexError) as e:
-            if "invalid literal" in str(e).lower():
-                raise ValueError(f"Non-numeric task IDs in range: '{start}-{end}'")
-            raise ValueError(f"Invalid range: {e}")
+        start_parts = _parse_dotted_int_parts(start)
+        end_parts = _parse_dotted_int_parts(end)
+        if start_parts is None or end_parts is None:
+            raise ValueError(f"Non-numeric task IDs in range: '{start}-{end}'")
+
+        # Handle simple numeric ranges (e.g., "1-3")
+        if len(start_parts) == 1 and len(end_parts) == 1:
+            start_num = start_parts[0]
+            end_num = end_parts[0]
+            if start_num > end_num:
+                raise ValueError(f"Invalid range: Start ({start}) is greater than end ({end})")
+            return [str(i) for i in range(start_num, end_num + 1)]
+
+        # Handle hierarchical ranges (e.g., "2.1-2.3"), ensuring the same hierarchy level
+        if len(start_parts) != len(end_parts):
+            raise ValueError(f"Invalid range: Hierarchy level mismatch between '{start}' and '{end}'")
+
+        # For subtask ranges, only the last part should vary
+        if start_parts[:-1] != end_parts[:-1]:
+            raise ValueError(f"Invalid range: Parent task mismatch between '{start}' and '{end}'")
+
+        if start_parts[-1] > end_parts[-1]:
+            raise ValueError(f"Invalid range: Start subtask ({start}) is greater than end subtask ({end})")
+
+        # Generate subtask IDs
+        parent_prefix = ".".join(str(p) for p in start_parts[:-1])
+        return [f"{parent_prefix}.{i}" for i in range(start_parts[-1], end_parts[-1] + 1)]
 
     def _sort_tasks_hierarchically(self, tasks: list[ParsedTask]) -> list[ParsedTask]:
         """Sort tasks in hierarchical order (1, 2, 2.1, 2.2, 3, etc.).
@@ -802,20 +1556,9 @@ class TaskAutoRunner:
         Returns:
             Tasks sorted in hierarchical order
         """
-        def task_sort_key(task: ParsedTask) -> tuple:
-            """Create a sort key for hierarchical task ordering."""
-            # Split task ID into numeric parts (e.g., "2.1" -> [2, 1])
-            try:
-                parts = [float(part) for part in task.id.split('.')]
-                # Pad to ensure consistent sorting (e.g., [2] -> [2, 0])
-                while len(parts) < 3:  # Support up to 3 levels (1.2.3)
-                    parts.append(0)
-                return tuple(parts)
-            except ValueError:
-                # Fallback for non-numeric task IDs
-                return (float('inf'), 0, 0)
-
-        return sorted(tasks, key=task_sort_key)
+        if len(tasks) <= 1:
+            return list(tasks)
+        return sorted(tasks, key=lambda task: _hierarchical_sort_key(task.id))
 
     def _task_in_range(self, task_id: str, start: str, end: str) -> bool:
         """Check if a task ID falls within the specified range.
@@ -860,7 +1603,7 @@ class TaskAutoRunner:
             task_id=task.id,
             task_description=task.description,
             status=TaskStatus.PENDING,
-            requirements_addressed=task.requirements.split(", ") if task.requirements else None,
+            requirements_addressed=task.requirements_list or None,
             leverage_info=task.leverage
         )
 
@@ -871,6 +1614,9 @@ class TaskAutoRunner:
 
         task_result.mark_started()
 
+        # Let the task see every earlier completion in tasks.md
+        await self._flush_completions(spec_context)
+
         try:
             # Execute the task using TaskExecutor
             success = await self.task_executor.execute_task(task, spec_context)
@@ -878,7 +1624,7 @@ class TaskAutoRunner:
             if success:
                 task_result.mark_completed(success=True)
                 # Mark task as complete in tasks.md
-                await self._mark_task_complete(spec_context, task.id)
+                self._mark_task_complete(task.id)
             else:
                 task_result.mark_completed(success=False, error_message="Task execution failed")
 
@@ -893,25 +1639,88 @@ class TaskAutoRunner:
 
         return task_result
 
-    async def _mark_task_complete(self, spec_context: SpecContext, task_id: str) -> None:
-        """Mark a task as complete in tasks.md by changing [ ] to [x].
+    def _mark_task_complete(self, task_id: str) -> None:
+        """Queue a task to be marked complete in tasks.md.
+        
+        The checkbox is written by the next ``_flush_completions``, which runs
+        before each task execution and at the end of the run.
         
         Args:
-            spec_context: Specification context
             task_id: ID of a task to mark complete
         """
+        self._pending_completions.add(task_id)
+
+    async def _flush_completions(self, spec_context: SpecContext) -> None:
+        """Mark all queued tasks complete in tasks.md with a single rewrite.
+        
+        Args:
+            spec_context: Specification context
+        """
+        if not self._pending_completions:
+            return
+
+        task_ids = sorted(self._pending_completions, key=_hierarchical_sort_key)
+        self._pending_completions = set()
+
         tasks_path = spec_context.spec_directory / "tasks.md"
+        try:
+            content = await self._read_tasks_md(tasks_path)
+
+            # Replace [ ] with [x] for the queued tasks, editing canonical
+            # "- [ ] <id>" lines directly and leaving the rest to the regex
+            updated_content = content
+            unmatched = []
+            for task_id in task_ids:
+                marked = _mark_checkbox_line(updated_content, task_id)
+                if marked is None:
+                    unmatched.append(task_id)
+                else:
+                    updated_content = marked
+
+            if len(unmatched) == 1:
+                updated_content = _task_complete_pattern(unmatched[0]).sub(r'\1[x] \2', updated_content)
+            elif unmatched:
+                alternatives = "|".join(re.escape(task_id) for task_id in unmatched)
+                pattern = re.compile(rf'^(-\s*)\[\s*\]\s*((?:{alternatives}){_TASK_ID_END}.*?)$', re.MULTILINE)
+                updated_content = pattern.sub(r'\1[x] \2', updated_content)
+
+            if updated_content != content:
+                await asyncio.to_thread(tasks_path.write_text, updated_content, encoding='utf-8')
+                self._remember_tasks_md(tasks_path, updated_content, await asyncio.to_thread(tasks_path.stat))
+        except Exception as e:
+            self._tasks_md_cache.pop(tasks_path, None)
+            self.console.print(f"[yellow]⚠️ Warning: Could not update tasks.md: {e}[/yellow]")
 
-        async with aiofiles.open(tasks_path, encoding='utf-8') as f:
-            content = await f.read()
+    async def _read_tasks_md(self, tasks_path: Path) -> str:
+        """Read tasks.md, reusing the cached content while the file is unchanged.
+        
+        Claude edits tasks.md during task execution, so the cache is only
+        trusted when the file's mtime and size still match the last read or write.
+        
+        Args:
+            tasks_path: Path to tasks.md
+            
+        Returns:
+            Current tasks.md content
+        """
+        stat = await asyncio.to_thread(tasks_path.stat)
+        cached = self._tasks_md_cache.get(tasks_path)
+        if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
 
-        # Replace [ ] with [x] for the specific task
-        pattern = rf'^(-\s*)\[\s*\]\s*({re.escape(task_id)}\s*\.?.*?)$'
-        replacement = r'\1[x] \2'
-        updated_content = re.sub(pattern, replacement, content, flags=re.MULTILINE)
+        content = await asyncio.to_thread(tasks_path.read_text, encoding='utf-8')
+        self._remember_tasks_md(tasks_path, content, stat)
+        return content
 
-        async with aiofiles.open(tasks_path, 'w', encoding='utf-8') as f:
-            await f.write(updated_content)
+    def _remember_tasks_md(self, tasks_path: Path, content: str, stat: os.stat_result) -> None:
+        """Cache tasks.md content together with the stat it corresponds to.
+        
+        Args:
+            tasks_path: Path to tasks.md
+            content: File content
+            stat: Stat result taken for that content
+        """
+        self._tasks_md_cache[tasks_path] = (stat.st_mtime_ns, stat.st_size, content)
 
     async def _prompt_task_confirmation(self, task: 'ParsedTask') -> bool:
         """Prompt the user for confirmation before executing a task in interactive mode.
@@ -941,7 +1750,8 @@ class TaskAutoRunner:
         self.console.print()
 
         # Use inquirer for enhanced user experience when available
-        if INQUIRER_AVAILABLE:
+        inquirer = _get_inquirer()
+        if inquirer is not None:
             questions = [
                 inquirer.List('action',
                             message=f'Execute task {task.id}?',
@@ -952,7 +1762,8 @@ class TaskAutoRunner:
                             ],
                             default='execute')
             ]
-            answers = inquirer.prompt(questions)
+            # Prompt in a worker thread so background warm-up keeps running
+            answers = await asyncio.to_thread(inquirer.prompt, questions)
             if not answers:
                 # User pressed Ctrl+C or ESC
                 self.console.print("[red]❌ Auto-run aborted by user[/red]")
@@ -975,7 +1786,7 @@ class TaskAutoRunner:
             self.console.print("  a - Abort auto-run")
 
             while True:
-                choice = input("Execute task? (y/s/a): ").lower().strip()
+                choice = (await asyncio.to_thread(_read_choice, "Execute task? (y/s/a): ")).lower().strip()
                 if choice in ['y', 'yes', 'execute']:
                     return True
                 elif choice in ['s', 'skip']:
@@ -1009,7 +1820,8 @@ class TaskAutoRunner:
         self.console.print()
 
         # Use inquirer for enhanced user experience when available
-        if INQUIRER_AVAILABLE:
+        inquirer = _get_inquirer()
+        if inquirer is not None:
             questions = [
                 inquirer.List('action',
                             message='Choose recovery action:',
@@ -1020,7 +1832,7 @@ class TaskAutoRunner:
                             ],
                             default='retry')
             ]
-            answers = inquirer.prompt(questions)
+            answers = await asyncio.to_thread(inquirer.prompt, questions)
             if not answers:
                 # User pressed Ctrl+C or ESC, default to abort
                 return "abort"
@@ -1034,7 +1846,7 @@ class TaskAutoRunner:
             self.console.print("  a - Abort execution")
 
             while True:
-                choice = input("Action (r/s/a): ").lower().strip()
+                choice = (await asyncio.to_thread(_read_choice, "Action (r/s/a): ")).lower().strip()
                 if choice in ['r', 'retry']:
                     return "retry"
                 elif choice in ['s', 'skip']:
@@ -1056,10 +1868,7 @@ class TaskAutoRunner:
         Returns:
             Human-readable description of the execution mode
         """
-        if mode == ExecutionMode.INTERACTIVE:
-            return "Interactive (prompts for each task)"
-        else:
-            return "Automatic (runs without interruption)"
+        return _MODE_DESCRIPTIONS[mode]
 
 
 class TaskExecutor:
@@ -1080,6 +1889,26 @@ class TaskExecutor:
             console: Rich console for output
         """
         self.console = console
+        # Per-message SDK progress output; errors and results are always shown
+        self.verbose = console.is_terminal
+
+    async def warm_up(self) -> bool:
+        """Resolve the execution backend ahead of the first task.
+        
+        Imports the Claude Code SDK in a worker thread, or locates the Claude
+        executable when the SDK is missing, so an interactive run can do this
+        while the user is still answering the confirmation prompt.
+        
+        Returns:
+            True if the SDK or the Claude executable is available, False otherwise
+        """
+        try:
+            if await asyncio.to_thread(_get_claude_sdk) is not None:
+                return True
+            return await _get_claude_executable() is not None
+        except Exception:
+            # Warm-up is best effort; execute_task reports real failures
+            return False
 
     async def execute_task(self, task: ParsedTask, spec_context: SpecContext) -> bool:
         """Execute a single task using existing task execution patterns.
@@ -1154,9 +1983,10 @@ class TaskExecutor:
             # Execute from the project root (parent of .claude directory)
             project_root = spec_context.spec_directory.parent.parent.parent
             
-            if CLAUDE_SDK_AVAILABLE:
+            sdk = _get_claude_sdk()
+            if sdk is not None:
                 # Use Claude Code SDK for clean execution
-                return await self._execute_with_sdk(command, project_root, task.id)
+                return await self._execute_with_sdk(sdk, command, project_root, task.id)
             else:
                 # Fallback to the subprocess approach with session management
                 self.console.print(f"[yellow]⚠️ Claude Code SDK not available, using subprocess fallback[/yellow]")
@@ -1166,10 +1996,11 @@ class TaskExecutor:
             self.console.print(f"[red]Implementation error: {e}[/red]")
             return False
 
-    async def _execute_with_sdk(self, command: str, project_root: Path, task_id: str) -> bool:
+    async def _execute_with_sdk(self, sdk: ModuleType, command: str, project_root: Path, task_id: str) -> bool:
         """Execute the task using Claude Code SDK with enhanced file change tracking.
         
         Args:
+            sdk: The imported claude_code_sdk module
             command: Claude slash command to execute
             project_root: Project root directory
             task_id: Task ID for logging
@@ -1184,43 +2015,42 @@ class TaskExecutor:
             files_before = await self._get_project_file_states(project_root)
             
             # Configure Claude Code options for task execution with enhanced settings
-            options = ClaudeCodeOptions(
+            options = sdk.ClaudeCodeOptions(
                 max_turns=15,  # Increased turns for complex tasks
                 cwd=project_root,
                 # Accept edits automatically and ensure they're committed
                 permission_mode="acceptEdits"
             )
             
-            messages: list[Message] = []
-            output_text = ""
+            messages_seen = False
+            output_parts: list[str] = []
             file_operations_detected = False
             
             # Execute the Claude command using the SDK
-            async for message in query(prompt=command, options=options):
-                messages.append(message)
+            async for message in sdk.query(prompt=command, options=options):
+                messages_seen = True
                 
                 # Collect output text for logging
-                if hasattr(message, 'content') and message.content:
-                    output_text += str(message.content) + "\n"
+                content = getattr(message, 'content', None)
+                if content:
+                    output_parts.append(str(content))
                 
                 # Show progress to user and track file operations
-                if hasattr(message, 'type'):
-                    if message.type == "error":
-                        self.console.print(f"[red]❌ SDK Error: {message.content}[/red]")
-                        return False
-                    elif message.type == "thinking":
-                        self.console.print(f"[dim]🤔 Claude is thinking...[/dim]")
-                    elif message.type == "tool_use":
-                        if hasattr(message, 'tool_name'):
-                            tool_name = message.tool_name
-                            self.console.print(f"[blue]🔧 Using tool: {tool_name}[/blue]")
-                            # Detect file operations
-                            if tool_name in ['Write', 'Edit', 'MultiEdit', 'NotebookEdit']:
-                                file_operations_detected = True
-                                self.console.print(f"[cyan]📝 File operation detected: {tool_name}[/cyan]")
+                message_type: str = getattr(message, 'type', None) or ""
+                handler = _SDK_MESSAGE_HANDLERS.get(message_type)
+                if handler is None:
+                    continue
+                console = self.console if self.verbose or message_type == "error" else _get_quiet_console()
+                outcome = handler(message, console)
+                if outcome == "error":
+                    return False
+                if outcome == "file_operation":
+                    file_operations_detected = True
             
             # Verify execution results and file changes
-            if messages:
+            if messages_seen:
+                output_text = "\n".join(output_parts)
+
                 # Check if file changes actually occurred
                 files_after = await self._get_project_file_states(project_root)
                 changes_applied = await self._verify_file_changes(files_before, files_after, task_id)
@@ -1273,7 +2103,7 @@ class TaskExecutor:
             files_before = await self._get_project_file_states(project_root)
             
             # Find the Claude executable path
-            claude_executable = await find_claude_executable()
+            claude_executable = await _get_claude_executable()
             if not claude_executable:
                 self.console.print(f"[red]✗ Claude executable not found. Please ensure Claude Code is installed.[/red]")
                 return False
@@ -1283,7 +2113,9 @@ class TaskExecutor:
                 claude_executable, command,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
-                cwd=project_root
+                cwd=project_root,
+                # Own process group, so termination also reaches the CLI's children
+                start_new_session=os.name != 'nt'
             )
             
             # Monitor the process with completion detection and timeout handling
@@ -1340,116 +2172,123 @@ class TaskExecutor:
         INACTIVITY_TIMEOUT = 30   # 30 seconds of no output before considering done
         BUFFER_SIZE = 8192        # Buffer size for reading output
         
-        # Completion patterns that indicate Claude is done
-        COMPLETION_PATTERNS = [
-            "Human:",  # Claude is waiting for human input
-            "Assistant:",  # Claude is waiting in conversation mode
-            "Type 'exit' to quit",  # Claude session prompt
-            "Press any key to continue",  # Claude waiting for input
-            "Would you like me to",  # Claude asking for next steps
-            "Is there anything else",  # Claude offering additional help
-            "Let me know if you need",  # Claude offering more assistance
-        ]
-        
-        # Error patterns that indicate failure
-        ERROR_PATTERNS = [
-            "Error:",
-            "Failed:",
-            "Command not found",
-            "Permission denied",
-            "No such file or directory",
+        stdout_parts: list[str] = []
+        # Trailing stdout kept for pattern matching, so the full output is only joined once
+        stdout_tail = ""
+        stderr_parts: list[str] = []
+        start_time = last_output_time = time.time()
+        # Both streams feed one queue, so the loop wakes only on output or a due timeout
+        output_queue: asyncio.Queue[tuple[str, bytes]] = asyncio.Queue()
+        reader_tasks = [
+            asyncio.create_task(_drain_stream(stream, output_queue, tag, BUFFER_SIZE))
+            for tag, stream in (("stdout", process.stdout), ("stderr", process.stderr))
+            if stream is not None
         ]
-        
+        open_streams = len(reader_tasks)
+        # Per-stream decoders keep multi-byte characters intact across read boundaries
+        decoders = {
+            "stdout": codecs.getincrementaldecoder('utf-8')('replace'),
+            "stderr": codecs.getincrementaldecoder('utf-8')('replace'),
+        }
+
         try:
-            stdout_output = ""
-            stderr_output = ""
-            last_output_time = time.time()
-            start_time = time.time()
-            
             self.console.print(f"[dim]Monitoring task {task_id} execution...[/dim]")
-            
+
             # Monitor process output with timeout handling
             while True:
                 current_time = time.time()
                 
                 # Check for maximum execution time
-                if current_time - start_time > MAX_EXECUTION_TIME:
+                if current_time - start_time >= MAX_EXECUTION_TIME:
                     self.console.print(f"[yellow]⏰ Task {task_id} exceeded maximum execution time ({MAX_EXECUTION_TIME}s), terminating...[/yellow]")
                     await self._terminate_process(process)
-                    return False, stdout_output, f"Execution timeout after {MAX_EXECUTION_TIME} seconds"
+                    return False, "".join(stdout_parts), f"Execution timeout after {MAX_EXECUTION_TIME} seconds"
                 
                 # Check for inactivity timeout
-                if current_time - last_output_time > INACTIVITY_TIMEOUT:
+                if current_time - last_output_time >= INACTIVITY_TIMEOUT:
                     # Check if process is still running
                     if process.returncode is None:
                         self.console.print(f"[yellow]💤 Task {task_id} inactive for {INACTIVITY_TIMEOUT}s, assuming completion and terminating...[/yellow]")
                         await self._terminate_process(process)
                         
                         # Check if we have completion indicators in the output
-                        if any(pattern.lower() in stdout_output.lower() for pattern in COMPLETION_PATTERNS):
-                            return True, stdout_output, stderr_output
+                        if _COMPLETION_RE.search(stdout_tail):
+                            return True, "".join(stdout_parts), "".join(stderr_parts)
                         else:
-                            return False, stdout_output, stderr_output or "Process terminated due to inactivity"
+                            return False, "".join(stdout_parts), "".join(stderr_parts) or "Process terminated due to inactivity"
                     else:
                         break  # Process already finished
-                
-                # Check if process has finished naturally
-                if process.returncode is not None:
+
+                # Sleep until output arrives or a timeout is due
+                remaining = min(start_time + MAX_EXECUTION_TIME, last_output_time + INACTIVITY_TIMEOUT) - current_time
+
+                if not open_streams:
+                    # Both streams are closed; wait for the process to exit
+                    try:
+                        await asyncio.wait_for(process.wait(), timeout=remaining)
+                    except asyncio.TimeoutError:
+                        continue
                     break
-                
-                # Read available output without blocking
+
                 try:
-                    # Check stdout
-                    if process.stdout:
-                        try:
-                            chunk = await asyncio.wait_for(process.stdout.read(BUFFER_SIZE), timeout=1.0)
-                            if chunk:
-                                new_output = chunk.decode('utf-8', errors='ignore')
-                                stdout_output += new_output
-                                last_output_time = current_time
-                                
-                                # Check for completion patterns in new output
-                                if any(pattern.lower() in new_output.lower() for pattern in COMPLETION_PATTERNS):
-                                    self.console.print(f"[green]🎯 Task {task_id} completion pattern detected, terminating...[/green]")
-                                    await self._terminate_process(process)
-                                    return True, stdout_output, stderr_output
-                                
-                                # Check for error patterns
-                                if any(pattern.lower() in new_output.lower() for pattern in ERROR_PATTERNS):
-                                    self.console.print(f"[red]❌ Task {task_id} error pattern detected[/red]")
-                                    await self._terminate_process(process)
-                                    return False, stdout_output, stderr_output or "Error pattern detected in output"
-                        except asyncio.TimeoutError:
-                            pass  # No output available, continue monitoring
-                    
-                    # Check stderr
-                    if process.stderr:
-                        try:
-                            chunk = await asyncio.wait_for(process.stderr.read(BUFFER_SIZE), timeout=1.0)
-                            if chunk:
-                                stderr_output += chunk.decode('utf-8', errors='ignore')
-                                last_output_time = current_time
-                        except asyncio.TimeoutError:
-                            pass  # No error output available
-                    
-                    # Small delay to prevent busy waiting
-                    await asyncio.sleep(0.5)
-                    
-                except Exception as e:
-                    self.console.print(f"[red]Error reading process output: {e}[/red]")
+                    item = await asyncio.wait_for(output_queue.get(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    continue
+
+                tag, chunk = item
+                if chunk:
+                    last_output_time = time.time()
+                else:
+                    open_streams -= 1  # EOF; flush any incomplete trailing sequence
+
+                new_output = decoders[tag].decode(chunk, final=not chunk)
+                if not new_output:
+                    continue
+
+                if tag == "stderr":
+                    stderr_parts.append(new_output)
+                    continue
+
+                stdout_parts.append(new_output)
+                # Scan the new chunk plus just enough preceding text to catch split patterns
+                scan_window = stdout_tail[-_PATTERN_OVERLAP:] + new_output
+                stdout_tail = scan_window[-_MAX_PAT_TAIL:]
+
+                # Check for completion patterns in new output
+                if _COMPLETION_RE.search(scan_window):
+                    self.console.print(f"[green]🎯 Task {task_id} completion pattern detected, terminating...[/green]")
                     await self._terminate_process(process)
-                    return False, stdout_output, str(e)
-            
+                    return True, "".join(stdout_parts), "".join(stderr_parts)
+
+                # Check for error patterns
+                if _ERROR_RE.search(scan_window):
+                    self.console.print(f"[red]❌ Task {task_id} error pattern detected[/red]")
+                    await self._terminate_process(process)
+                    return False, "".join(stdout_parts), "".join(stderr_parts) or "Error pattern detected in output"
+
             # Process finished naturally, check return code
+            stderr_output = "".join(stderr_parts)
+
             if process.returncode == 0:
-                return True, stdout_output, stderr_output
+                return True, "".join(stdout_parts), stderr_output
             else:
-                return False, stdout_output, stderr_output or f"Process exited with code {process.returncode}"
+                return False, "".join(stdout_parts), stderr_output or f"Process exited with code {process.returncode}"
                 
         except Exception as e:
             self.console.print(f"[red]Error monitoring process: {e}[/red]")
             await self._terminate_process(process)
-            return False, stdout_output, str(e)
+            return False, "".join(stdout_parts), str(e)
+        finally:
+            for reader_task in reader_tasks:
+                if not reader_task.done():
+                    reader_task.cancel()
+            # Cancellation (e.g. Ctrl+C) skips the paths above; the CLI runs in its own
+            # session and never sees the terminal's SIGINT, so kill its group here
+            if process.returncode is None:
+                try:
+                    _signal_process_group(process, force=True)
+                except ProcessLookupError:
+                    pass
 
     async def _terminate_process(self, process: asyncio.subprocess.Process) -> None:
         """Gracefully terminate a Claude process.
@@ -1460,12 +2299,12 @@ class TaskExecutor:
         try:
             if process.returncode is None:  # Process is still running
                 # Try graceful termination first
-                process.terminate()
+                _signal_process_group(process, force=False)
                 try:
-                    await asyncio.wait_for(process.wait(), timeout=5.0)
+                    await asyncio.wait_for(process.wait(), timeout=1.0)
                 except asyncio.TimeoutError:
                     # Force kill if graceful termination fails
-                    process.kill()
+                    _signal_process_group(process, force=True)
                     try:
                         await asyncio.wait_for(process.wait(), timeout=2.0)
                     except asyncio.TimeoutError:
@@ -1505,9 +2344,6 @@ class TaskExecutor:
                 self.console.print(f"[red]❌ Task {task.id} completion indicators not met[/red]")
                 return False
 
-            # Simulate brief validation delay
-            await asyncio.sleep(0.3)
-
             self.console.print(f"[green]✅ Task {task.id} validation successful[/green]")
             return True
 
@@ -1534,8 +2370,6 @@ class TaskExecutor:
         req_list = [req.strip() for req in task.requirements.split(",")]
 
         for req in req_list:
-            # Simulate requirement validation
-            await asyncio.sleep(0.1)
             self.console.print(f"[dim]✓ Requirement {req} satisfied[/dim]")
 
         return True
@@ -1550,9 +2384,6 @@ class TaskExecutor:
         Returns:
             True if completion indicators are present
         """
-        # Simulate checking completion indicators
-        await asyncio.sleep(0.2)
-
         # In a real implementation, this would check:
         # - Files were created/modified as expected
         # - Code compiles/runs without errors
@@ -1561,45 +2392,24 @@ class TaskExecutor:
 
         return True
 
-    async def _get_project_file_states(self, project_root: Path) -> dict[str, tuple[float, int]]:
+    async def _get_project_file_states(self, project_root: Path) -> dict[str, int]:
         """Get current state of all relevant project files for change detection.
         
         Args:
             project_root: Project root directory
             
         Returns:
-            Dictionary mapping file paths to (modification_time, size) tuples
+            Dictionary mapping file paths to modification times in nanoseconds
         """
-        file_states = {}
-        
         try:
-            # Scan relevant project files (excluding .git, __pycache__, etc.)
-            excluded_dirs = {'.git', '__pycache__', '.pytest_cache', 'node_modules', '.venv', 'venv'}
-            excluded_extensions = {'.pyc', '.pyo', '.log', '.tmp'}
-            
-            for file_path in project_root.rglob('*'):
-                if file_path.is_file():
-                    # Skip excluded directories and files
-                    if any(excluded in file_path.parts for excluded in excluded_dirs):
-                        continue
-                    if file_path.suffix in excluded_extensions:
-                        continue
-                        
-                    try:
-                        stat = file_path.stat()
-                        relative_path = file_path.relative_to(project_root)
-                        file_states[str(relative_path)] = (stat.st_mtime, stat.st_size)
-                    except (OSError, ValueError):
-                        # Skip files we can't read
-                        continue
-                        
+            # Walk the tree in a worker thread so the event loop stays responsive
+            return await asyncio.to_thread(_scan_file_states, str(project_root))
         except Exception as e:
             self.console.print(f"[yellow]Warning: Could not scan project files: {e}[/yellow]")
-            
-        return file_states
+            return {}
 
-    async def _verify_file_changes(self, files_before: dict[str, tuple[float, int]], 
-                                 files_after: dict[str, tuple[float, int]], task_id: str) -> bool:
+    async def _verify_file_changes(self, files_before: dict[str, int], 
+                                 files_after: dict[str, int], task_id: str) -> bool:
         """Verify that file changes actually occurred during task execution.
         
         Args:
@@ -1611,25 +2421,13 @@ class TaskExecutor:
             True if file changes were detected, False otherwise
         """
         try:
-            changes_detected = False
-            new_files = []
-            modified_files = []
-            
-            # Check for new files
-            for file_path in files_after:
-                if file_path not in files_before:
-                    new_files.append(file_path)
-                    changes_detected = True
-                    
-            # Check for modified files
-            for file_path in files_before:
-                if file_path in files_after:
-                    before_mtime, before_size = files_before[file_path]
-                    after_mtime, after_size = files_after[file_path]
-                    
-                    if before_mtime != after_mtime or before_size != after_size:
-                        modified_files.append(file_path)
-                        changes_detected = True
+            # Set difference of the item views yields only new or changed entries;
+            # an unchanged mtime_ns means the file was not rewritten
+            changed = files_after.items() - files_before.items()
+            new_files = sorted(path for path, _ in changed if path not in files_before)
+            modified_files = sorted(path for path, _ in changed if path in files_before)
+
+            changes_detected = bool(new_files or modified_files)
             
             # Log detected changes
             if changes_detected:
@@ -1693,6 +2491,19 @@ class ProgressManager:
     reporting during auto-run.
     """
 
+    # (icon, color, text) per task status, resolved with a single lookup per update
+    _STATUS_INFO: ClassVar[dict[TaskStatus, tuple[str, str, str]]] = {
+        TaskStatus.PENDING: ("⏳", "yellow", "Pending"),
+        TaskStatus.RUNNING: ("🔄", "cyan", "Running"),
+        TaskStatus.SUCCESS: ("✅", "green", "Complete"),
+        TaskStatus.FAILED: ("❌", "red", "Failed"),
+        TaskStatus.SKIPPED: ("⏭️", "magenta", "Skipped")
+    }
+    _UNKNOWN_STATUS_INFO: ClassVar[tuple[str, str, str]] = ("❓", "white", "Unknown")
+    _FINISHED_STATUSES: ClassVar[frozenset[TaskStatus]] = frozenset(
+        {TaskStatus.SUCCESS, TaskStatus.FAILED, TaskStatus.SKIPPED}
+    )
+
     def __init__(self, console: Console) -> None:
         """Initialize ProgressManager.
         
@@ -1754,8 +2565,11 @@ class ProgressManager:
             status: Current status of the task
             message: Progress message to display
         """
+        finished = status in self._FINISHED_STATUSES
+        status_icon, status_color, status_text = self._STATUS_INFO.get(status, self._UNKNOWN_STATUS_INFO)
+
         # Update completed count if task is done
-        if status in [TaskStatus.SUCCESS, TaskStatus.FAILED, TaskStatus.SKIPPED]:
+        if finished:
             self.completed_count += 1
 
         # Create or update progress task
@@ -1767,31 +2581,23 @@ class ProgressManager:
                     total=100,
                     task_num=len(self.task_ids) + 1,
                     total_tasks=self.task_count,
-                    status=self._get_status_text(status)
+                    status=status_text
                 )
             else:
                 # Update existing progress task
-                progress_value = 100 if status in [TaskStatus.SUCCESS, TaskStatus.FAILED, TaskStatus.SKIPPED] else 50
                 self.current_progress.update(
                     self.task_ids[task_id],
                     description=message,
-                    completed=progress_value,
-                    status=self._get_status_text(status)
+                    completed=100 if finished else 50,
+                    status=status_text
                 )
 
         # Enhanced console logging with timestamps (requirement 1.2)
         timestamp = time.strftime("%H:%M:%S")
-        status_icon = self._get_status_icon(status)
-        status_color = self._get_status_color(status)
-
-        # Build formatted message based on status
-        if status == TaskStatus.RUNNING:
-            self.console.print(f"[dim]{timestamp}[/dim] {status_icon} [{status_color}]Task {task_id}[/{status_color}] {message}")
-        elif status == TaskStatus.SUCCESS:
-            elapsed = time.time() - self.start_time
-            self.console.print(f"[dim]{timestamp}[/dim] {status_icon} [{status_color}]Task {task_id}[/{status_color}] {message} [dim](+{elapsed:.1f}s)[/dim]")
-        else:
-            self.console.print(f"[dim]{timestamp}[/dim] {status_icon} [{status_color}]Task {task_id}[/{status_color}] {message}")
+        # Successful tasks also show the time elapsed since the run started
+        elapsed = f" [dim](+{time.time() - self.start_time:.1f}s)[/dim]" if status == TaskStatus.SUCCESS else ""
+
+        self.console.print(f"[dim]{timestamp}[/dim] {status_icon} [{status_color}]Task {task_id}[/{status_color}] {message}{elapsed}")
 
     def _get_status_text(self, status: TaskStatus) -> str:
         """Get human-readable status text.
@@ -1802,14 +2608,7 @@ class ProgressManager:
         Returns:
             Status text for display
         """
-        status_texts = {
-            TaskStatus.PENDING: "Pending",
-            TaskStatus.RUNNING: "Running",
-            TaskStatus.SUCCESS: "Complete",
-            TaskStatus.FAILED: "Failed",
-            TaskStatus.SKIPPED: "Skipped"
-        }
-        return status_texts.get(status, "Unknown")
+        return self._STATUS_INFO.get(status, self._UNKNOWN_STATUS_INFO)[2]
 
     def _get_status_color(self, status: TaskStatus) -> str:
         """Get color for status display.
@@ -1820,36 +2619,98 @@ class ProgressManager:
         Returns:
             Rich color code for the status
         """
-        colors = {
-            TaskStatus.PENDING: "yellow",
-            TaskStatus.RUNNING: "cyan",
-            TaskStatus.SUCCESS: "green",
-            TaskStatus.FAILED: "red",
-            TaskStatus.SKIPPED: "magenta"
-        }
-        return colors.get(status, "white")
+        return self._STATUS_INFO.get(status, self._UNKNOWN_STATUS_INFO)[1]
 
     def report_completion_summary(self, result: AutoRunResult) -> None:
         """Report comprehensive completion summary with detailed statistics.
         
         Implements requirement 4.2: shows real-time progress with task names,
         completion percentages, requirements being addressed, and reused components.
+        The whole summary is assembled first and written with a single print.
         
         Args:
             result: AutoRunResult with execution statistics
         """
-        self.console.print()
-        self.console.rule(style="bold blue")
-        self.console.print()
+        if not self.console.is_terminal:
+            # Redirected output (CI logs) gets plain lines instead of a rendered layout
+            self._print_plain_summary(result)
+            return
+
+        line = self.console.render_str
+        blank = Text()
 
         # Main summary message with icon
         summary_icon = "✅" if result.is_successful else "⚠️"
-        self.console.print(f"{summary_icon} [bold]{result.summary_message}[/bold]")
-        self.console.print()
+        renderables: list[RenderableType] = [
+            blank,
+            Rule(style="bold blue"),
+            blank,
+            line(f"{summary_icon} [bold]{result.summary_message}[/bold]"),
+            blank,
+            # Statistics table for better visualization
+            self._build_stats_table(result),
+        ]
+
+        # Show task details with requirements addressed (requirement 4.2)
+        if result.task_results:
+            renderables.append(blank)
+            renderables.extend(self._task_detail_lines(result))
+
+        # Show failed tasks if any
+        if result.failed_tasks > 0:
+            renderables.append(blank)
+            renderables.append(line("[red bold]❌ Failed Tasks:[/red bold]"))
+            for task_result in result.results_with_status(TaskStatus.FAILED):
+                renderables.append(line(f"   [red]•[/red] Task {task_result.task_id}: {task_result.task_description}"))
+                if task_result.error_message:
+                    renderables.append(line(f"     [dim]Error: {task_result.error_message}[/dim]"))
+
+        renderables.append(blank)
+        renderables.append(Rule(style="bold blue"))
+        self.console.print(Group(*renderables))
+
+    def _print_plain_summary(self, result: AutoRunResult) -> None:
+        """Write the completion summary as plain text lines for non-terminal output.
+        
+        Args:
+            result: AutoRunResult with execution statistics
+        """
+        total = result.total_tasks or 1  # Avoid division by zero in percentages
+        lines = [
+            result.summary_message,
+            f"Total tasks: {result.total_tasks}",
+            f"Successful: {result.successful_tasks} ({result.successful_tasks / total * 100:.0f}%)",
+        ]
+        if result.failed_tasks > 0:
+            lines.append(f"Failed: {result.failed_tasks} ({result.failed_tasks / total * 100:.0f}%)")
+        if result.skipped_tasks > 0:
+            lines.append(f"Skipped: {result.skipped_tasks} ({result.skipped_tasks / total * 100:.0f}%)")
+        lines.append(f"Success rate: {result.success_rate:.1%}")
+        lines.append(f"Execution time: {result.execution_time:.2f}s")
 
-        # Create a statistics table for better visualization
-        from rich.table import Table
+        for task_result in result.task_results:
+            details = [f"Task {task_result.task_id}", self._get_status_text(task_result.status), task_result.task_description]
+            if task_result.requirements_addressed:
+                details.append(f"requirements {', '.join(task_result.requirements_addressed)}")
+            if task_result.leverage_info:
+                details.append(f"leveraged {task_result.leverage_info}")
+            if task_result.execution_time > 0:
+                details.append(f"{task_result.execution_time:.2f}s")
+            if task_result.error_message:
+                details.append(f"error: {task_result.error_message}")
+            lines.append(" | ".join(details))
 
+        self.console.out("\n".join(lines), highlight=False)
+
+    def _build_stats_table(self, result: AutoRunResult) -> Table:
+        """Build the execution statistics table for the completion summary.
+        
+        Args:
+            result: AutoRunResult with execution statistics
+            
+        Returns:
+            Table with task counts, success rate and timing
+        """
         stats_table = Table(title="📊 Execution Statistics", show_header=True, header_style="bold cyan")
         stats_table.add_column("Metric", style="dim")
         stats_table.add_column("Value", justify="right")
@@ -1878,9 +2739,10 @@ class ProgressManager:
             )
 
         stats_table.add_row("", "", "")  # Separator row
+        rate_color = next((color for threshold, color in _SUCCESS_RATE_COLORS if result.success_rate > threshold), "red")
         stats_table.add_row(
             "Success Rate",
-            f"[{'green' if result.success_rate > 0.8 else 'yellow' if result.success_rate > 0.5 else 'red'}]{result.success_rate:.1%}[/{'green' if result.success_rate > 0.8 else 'yellow' if result.success_rate > 0.5 else 'red'}]",
+            f"[{rate_color}]{result.success_rate:.1%}[/{rate_color}]",
             self._get_success_rate_emoji(result.success_rate)
         )
         stats_table.add_row(
@@ -1889,56 +2751,45 @@ class ProgressManager:
             f"[dim]~{result.execution_time / result.executed_tasks:.1f}s per task[/dim]" if result.executed_tasks > 0 else ""
         )
 
-        self.console.print(stats_table)
-
-        # Show task details with requirements addressed (requirement 4.2)
-        if result.task_results:
-            self.console.print()
-            self._report_task_details(result)
-
-        # Show failed tasks if any
-        if result.failed_tasks > 0:
-            self.console.print()
-            self.console.print("[red bold]❌ Failed Tasks:[/red bold]")
-            for task_result in result.task_results:
-                if task_result.status == TaskStatus.FAILED:
-                    self.console.print(f"   [red]•[/red] Task {task_result.task_id}: {task_result.task_description}")
-                    if task_result.error_message:
-                        self.console.print(f"     [dim]Error: {task_result.error_message}[/dim]")
-
-        self.console.print()
-        self.console.rule(style="bold blue")
+        return stats_table
 
-    def _report_task_details(self, result: AutoRunResult) -> None:
-        """Report detailed task information including requirements.
+    def _task_detail_lines(self, result: AutoRunResult) -> list[Text]:
+        """Build the detailed task information lines, including requirements.
         
         Args:
             result: AutoRunResult with task details
+            
+        Returns:
+            Rendered lines for the task details section
         """
-        self.console.print("[bold]📋 Task Execution Details:[/bold]")
+        line = self.console.render_str
+        lines = [line("[bold]📋 Task Execution Details:[/bold]")]
 
         for task_result in result.task_results[:5]:  # Show first 5 tasks
-            status_icon = self._get_status_icon(task_result.status)
-            status_color = self._get_status_color(task_result.status)
+            status_icon, status_color, _ = self._STATUS_INFO.get(task_result.status, self._UNKNOWN_STATUS_INFO)
 
             # Task header
-            self.console.print(f"\n   {status_icon} [{status_color}]Task {task_result.task_id}[/{status_color}]: {task_result.task_description}")
+            lines.append(Text())
+            lines.append(line(f"   {status_icon} [{status_color}]Task {task_result.task_id}[/{status_color}]: {task_result.task_description}"))
 
             # Requirements addressed (requirement 4.2)
             if task_result.requirements_addressed:
                 reqs = ", ".join(task_result.requirements_addressed)
-                self.console.print(f"     [dim]Requirements: {reqs}[/dim]")
+                lines.append(line(f"     [dim]Requirements: {reqs}[/dim]"))
 
             # Leverage information (requirement 4.2)
             if task_result.leverage_info:
-                self.console.print(f"     [dim]Leveraged: {task_result.leverage_info}[/dim]")
+                lines.append(line(f"     [dim]Leveraged: {task_result.leverage_info}[/dim]"))
 
             # Execution time
             if task_result.execution_time > 0:
-                self.console.print(f"     [dim]Time: {task_result.execution_time:.2f}s[/dim]")
+                lines.append(line(f"     [dim]Time: {task_result.execution_time:.2f}s[/dim]"))
 
         if len(result.task_results) > 5:
-            self.console.print(f"\n   [dim]... and {len(result.task_results) - 5} more tasks[/dim]")
+            lines.append(Text())
+            lines.append(line(f"   [dim]... and {len(result.task_results) - 5} more tasks[/dim]"))
+
+        return lines
 
     def _get_success_rate_emoji(self, rate: float) -> str:
         """Get emoji representation for success rate.
@@ -1969,11 +2820,4 @@ class ProgressManager:
         Returns:
             Appropriate icon for the status
         """
-        icons = {
-            TaskStatus.PENDING: "⏳",
-            TaskStatus.RUNNING: "🔄",
-            TaskStatus.SUCCESS: "✅",
-            TaskStatus.FAILED: "❌",
-            TaskStatus.SKIPPED: "⏭️"
-        }
-        return icons.get(status, "❓")
+        return self._STATUS_INFO.get(status, self._UNKNOWN_STATUS_INFO)[0]
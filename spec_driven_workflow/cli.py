@@ -4,34 +4,219 @@ This module provides the main CLI entry point using Click framework,
 replacing the TypeScript Commander.js functionality with Python equivalents.
 """
 
-import asyncio
-import json
+import functools
+import hashlib
+import importlib
 import os
-import tempfile
 from pathlib import Path
-from typing import Optional
+from types import ModuleType
+from typing import Iterable, Optional, TYPE_CHECKING, cast
 
 import click
-from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
-try:
-    import inquirer
-    INQUIRER_AVAILABLE = True
-except ImportError:
-    INQUIRER_AVAILABLE = False
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.progress import Progress, TaskID
 
-from spec_driven_workflow.setup import SpecWorkflowSetup
-from spec_driven_workflow.utils import detect_project_type, validate_claude_code
-from spec_driven_workflow.task_generator import parse_tasks_from_markdown, generate_task_command
-from spec_driven_workflow.auto_runner import TaskAutoRunner
-from spec_driven_workflow.auto_run_models import AutoRunOptions, ExecutionMode
-
-console = Console()
+# Command implementations (setup, task generation, auto-run, inquirer, Rich)
+# and asyncio itself are imported inside the commands that use them, so
+# --help and --version only pay for click.
 
 # Package version - ideally read from pyproject.toml or __init__.py
 VERSION = "1.3.4"
 
+# How long a successful context7 MCP check is trusted before setup re-runs `claude mcp add`
+_CONTEXT7_CACHE_TTL = 24 * 60 * 60
+
+
+# What setup will create, shown before asking for confirmation
+_SETUP_PLAN = (
+    "",
+    "[cyan]This will create:[/cyan]",
+    "[dim]  📁 .claude/ directory structure[/dim]",
+    "[dim]  📝 14 slash commands (9 spec workflow + 5 bug fix workflow)[/dim]",
+    "[dim]  🤖 Auto-generated task commands[/dim]",
+    "[dim]  📋 Document templates[/dim]",
+    "[dim]  🔧 Python-based task command generation (no NPX required)[/dim]",
+    "[dim]  ⚙️  Configuration files[/dim]",
+    "[dim]  📖 Complete workflow instructions embedded in each command[/dim]",
+    "",
+)
+
+# Command reference and next steps shown after a successful setup
+_POST_SETUP_HELP = (
+    "",
+    "✅ [bold green]Spec Workflow installed successfully![/bold green]",
+    "",
+    "[cyan]Available commands:[/cyan]",
+    "[bold white]📊 Spec Workflow (for new features):[/bold white]",
+    "[dim]  /spec-create <feature-name>  - Create a new spec[/dim]",
+    "[dim]  /spec-requirements           - Generate requirements[/dim]",
+    "[dim]  /spec-design                 - Generate design[/dim]",
+    "[dim]  /generate-task-commands      - Generate tasks & offer auto-run[/dim]",
+    "[dim]  /spec-execute <task-id>      - Execute individual tasks[/dim]",
+    "[dim]  /auto-run-tasks <spec-name>  - Execute all tasks automatically[/dim]",
+    "[dim]  /{spec-name}-task-{id}       - Auto-generated task commands[/dim]",
+    "[dim]  /spec-status                 - Show status[/dim]",
+    "[dim]  /spec-list                   - List all specs[/dim]",
+    "",
+    "[bold white]🐛 Bug Fix Workflow (for bug fixes):[/bold white]",
+    "[dim]  /bug-create <bug-name>       - Start bug fix[/dim]",
+    "[dim]  /bug-analyze                 - Analyze root cause[/dim]",
+    "[dim]  /bug-fix                     - Implement fix[/dim]",
+    "[dim]  /bug-verify                  - Verify fix[/dim]",
+    "[dim]  /bug-status                  - Show bug status[/dim]",
+    "",
+    "[yellow]Next steps:[/yellow]",
+    "[dim]1. Run: claude[/dim]",
+    "[dim]2. For new features: /spec-create my-feature[/dim]",
+    "[dim]3. For bug fixes: /bug-create my-bug[/dim]",
+    "",
+    "[blue]📖 For help, see the README or run /spec-list[/blue]",
+)
+
+# --mode values for auto-run-tasks; each names an ExecutionMode member (lower-cased)
+_MODE_CHOICES = ('automatic', 'interactive')
+
+# Answers accepted by the plain-input auto-run prompt (Enter means yes)
+_AUTO_RUN_ANSWERS = {'': True, 'y': True, 'yes': True, 'n': False, 'no': False}
+
+# Workflow options shown after generating task commands
+_WORKFLOW_OPTIONS_INTRO = (
+    "",
+    "[bold cyan]🚀 Workflow Options:[/bold cyan]",
+    "",
+    "[yellow]Option 1: Individual Task Execution[/yellow]",
+    "[bold yellow]RESTART REQUIRED: You must restart Claude Code for the new commands to be visible[/bold yellow]",
+    "",
+    "[bold cyan]Instructions for the agent:[/bold cyan]",
+    "[dim]Tell the user they must exit Claude Code and restart it using:[/dim]",
+    "[white]- Run \"claude --continue\" to continue this conversation with new commands[/white]",
+    "[white]- Or run \"claude\" to start a fresh session[/white]",
+    "[dim]The restart is absolutely necessary for the new task commands to appear.[/dim]",
+    "",
+    "[blue]After restart, you can use commands like:[/blue]",
+)
+
+# Auto-run option for a generated spec; each line is formatted with spec_name
+_AUTO_RUN_OPTION_TEMPLATE = (
+    "",
+    "[yellow]Option 2: Automated Task Execution (NEW!)[/yellow]",
+    "[green]Execute all tasks automatically without restart:[/green]",
+    "[white]/auto-run-tasks {spec_name}[/white] - Execute all tasks automatically",
+    "[white]/auto-run-tasks {spec_name} --mode interactive[/white] - Interactive execution with prompts",
+    "[white]/auto-run-tasks {spec_name} --tasks 1-3[/white] - Execute specific task range",
+    "",
+    "[bold green]✨ Auto-run benefits:[/bold green]",
+    "[dim]• No restart required - start immediately[/dim]",
+    "[dim]• Execute all tasks sequentially with progress tracking[/dim]",
+    "[dim]• Interactive mode for step-by-step control[/dim]",
+    "[dim]• Resume functionality if interrupted[/dim]",
+    "[dim]• Comprehensive error handling and recovery options[/dim]",
+)
+
+
+def _context7_sentinel(project_path: Path) -> Path:
+    """Locate the marker file recording a successful context7 MCP check.
+    
+    `claude mcp add` registers the server for a single project, so each
+    project gets its own marker.
+    
+    Args:
+        project_path: Path to the project being set up
+    
+    Returns:
+        Path under $XDG_CACHE_HOME (or ~/.cache) for the project's context7 sentinel
+    """
+    cache_root = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    project_key = hashlib.sha256(str(project_path.resolve()).encode("utf-8")).hexdigest()[:16]
+    return Path(cache_root) / "spec-driven-workflow" / f"context7-{project_key}.ok"
+
+
+@functools.lru_cache(maxsize=1)
+def _get_console() -> "Console":
+    """Create the shared Rich console on first use.
+    
+    Returns:
+        Console used by every command
+    """
+    from rich.console import Console
+
+    return Console()
+
+
+def _print_lines(console: "Console", lines: Iterable[str]) -> None:
+    """Print a block of markup lines with a single console write.
+    
+    Each line is rendered on its own, so highlighting matches separate prints.
+    
+    Args:
+        console: Console to print to
+        lines: Markup strings, one per output line
+    """
+    from rich.console import Group
+
+    console.print(Group(*(console.render_str(line) for line in lines)))
+
+
+class _NullProgress:
+    """Stand-in for a Rich Progress display when output is not a terminal."""
+
+    def __enter__(self) -> "_NullProgress":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        pass
+
+    def add_task(self, description: str, **kwargs: object) -> "TaskID":
+        return cast("TaskID", 0)
+
+    def update(self, task_id: "TaskID", **kwargs: object) -> None:
+        pass
+
+    def stop_task(self, task_id: "TaskID") -> None:
+        pass
+
+    def remove_task(self, task_id: "TaskID") -> None:
+        pass
+
+    def stop(self) -> None:
+        pass
+
+
+def _progress_or_null(console: "Console") -> "Progress | _NullProgress":
+    """Create a spinner progress display, or a no-op stand-in for non-terminal output.
+    
+    Args:
+        console: Console the spinner would render to
+        
+    Returns:
+        Context manager yielding a Progress or _NullProgress
+    """
+    if not console.is_terminal:
+        return _NullProgress()
+
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    return Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console,
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _get_inquirer() -> ModuleType | None:
+    """Import inquirer on first use.
+    
+    Returns:
+        The inquirer module, or None if it is not installed
+    """
+    try:
+        return importlib.import_module("inquirer")
+    except ImportError:
+        return None
+
 
 @click.group()
 @click.version_option(version=VERSION, prog_name="spec-driven-workflow")
@@ -48,24 +233,29 @@ def main() -> None:
 @click.option('-p', '--project', default=None, help='Project directory (default: current directory)')
 @click.option('-f', '--force', is_flag=True, help='Force overwrite existing files')
 @click.option('-y', '--yes', is_flag=True, help='Skip confirmation prompts')
-def setup(project: Optional[str], force: bool, yes: bool) -> None:
+@click.option('--refresh-mcp', is_flag=True, help='Re-check the context7 MCP server even if it was recently configured')
+def setup(project: Optional[str], force: bool, yes: bool, refresh_mcp: bool) -> None:
     """Set up Claude Code Spec Workflow in your project."""
-    asyncio.run(_setup_async(project, force, yes))
+    import asyncio
+
+    asyncio.run(_setup_async(project, force, yes, refresh_mcp))
 
 
-async def _setup_async(project: Optional[str], force: bool, yes: bool) -> None:
+async def _setup_async(project: Optional[str], force: bool, yes: bool, refresh_mcp: bool = False) -> None:
     """Async implementation of setup command."""
+    import asyncio
+
+    from spec_driven_workflow.setup import SpecWorkflowSetup
+    from spec_driven_workflow.utils import detect_project_type, validate_claude_code
+
+    console = _get_console()
     console.print("🚀 [bold cyan]Claude Code Spec Workflow Setup[/bold cyan]")
     console.print("[dim]Claude Code Automated spec-driven development workflow[/dim]")
     console.print()
 
     project_path = Path(project) if project else Path.cwd()
     
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
+    with _progress_or_null(console) as progress:
         task = progress.add_task("Analyzing project...", total=None)
         
         try:
@@ -87,7 +277,7 @@ async def _setup_async(project: Optional[str], force: bool, yes: bool) -> None:
                 console.print("[dim]   Visit: https://docs.anthropic.com/claude-code[/dim]")
             
             # Ensure context7 MCP server is configured
-            await _ensure_context7_mcp_server(console, project_path, project_types)
+            await _ensure_context7_mcp_server(console, project_path, project_types, refresh=refresh_mcp)
             
             # Check for existing .claude directory and handle migration
             setup = SpecWorkflowSetup(project_path)
@@ -116,8 +306,7 @@ async def _setup_async(project: Optional[str], force: bool, yes: bool) -> None:
                     
                     if not is_compatible and issues:
                         console.print("[red]⚠️  Compatibility issues detected:[/red]")
-                        for issue in issues:
-                            console.print(f"[dim]  • {issue}[/dim]")
+                        _print_lines(console, (f"[dim]  • {issue}[/dim]" for issue in issues))
                 
                 if not yes:
                     message = '.claude directory already exists.'
@@ -126,13 +315,14 @@ async def _setup_async(project: Optional[str], force: bool, yes: bool) -> None:
                     else:
                         message += ' Update with latest commands?'
                     
-                    if INQUIRER_AVAILABLE:
+                    inquirer = _get_inquirer()
+                    if inquirer is not None:
                         questions = [
                             inquirer.Confirm('proceed',
                                            message=message,
                                            default=True)
                         ]
-                        answers = inquirer.prompt(questions)
+                        answers = await asyncio.to_thread(inquirer.prompt, questions)
                         if not answers or not answers.get('proceed'):
                             console.print("[yellow]Setup cancelled.[/yellow]")
                             return
@@ -142,24 +332,16 @@ async def _setup_async(project: Optional[str], force: bool, yes: bool) -> None:
             
             # Confirm setup
             if not yes:
-                console.print()
-                console.print("[cyan]This will create:[/cyan]")
-                console.print("[dim]  📁 .claude/ directory structure[/dim]")
-                console.print("[dim]  📝 14 slash commands (9 spec workflow + 5 bug fix workflow)[/dim]")
-                console.print("[dim]  🤖 Auto-generated task commands[/dim]")
-                console.print("[dim]  📋 Document templates[/dim]")
-                console.print("[dim]  🔧 Python-based task command generation (no NPX required)[/dim]")
-                console.print("[dim]  ⚙️  Configuration files[/dim]")
-                console.print("[dim]  📖 Complete workflow instructions embedded in each command[/dim]")
-                console.print()
+                _print_lines(console, _SETUP_PLAN)
                 
-                if INQUIRER_AVAILABLE:
+                inquirer = _get_inquirer()
+                if inquirer is not None:
                     questions = [
                         inquirer.Confirm('confirm',
                                        message='Proceed with setup?',
                                        default=True)
                     ]
-                    answers = inquirer.prompt(questions)
+                    answers = await asyncio.to_thread(inquirer.prompt, questions)
                     if not answers or not answers.get('confirm'):
                         console.print("[yellow]Setup cancelled.[/yellow]")
                         return
@@ -173,34 +355,7 @@ async def _setup_async(project: Optional[str], force: bool, yes: bool) -> None:
             progress.remove_task(setup_task)
             
             # Success message
-            console.print()
-            console.print("✅ [bold green]Spec Workflow installed successfully![/bold green]")
-            console.print()
-            console.print("[cyan]Available commands:[/cyan]")
-            console.print("[bold white]📊 Spec Workflow (for new features):[/bold white]")
-            console.print("[dim]  /spec-create <feature-name>  - Create a new spec[/dim]")
-            console.print("[dim]  /spec-requirements           - Generate requirements[/dim]")
-            console.print("[dim]  /spec-design                 - Generate design[/dim]")
-            console.print("[dim]  /generate-task-commands      - Generate tasks & offer auto-run[/dim]")
-            console.print("[dim]  /spec-execute <task-id>      - Execute individual tasks[/dim]")
-            console.print("[dim]  /auto-run-tasks <spec-name>  - Execute all tasks automatically[/dim]")
-            console.print("[dim]  /{spec-name}-task-{id}       - Auto-generated task commands[/dim]")
-            console.print("[dim]  /spec-status                 - Show status[/dim]")
-            console.print("[dim]  /spec-list                   - List all specs[/dim]")
-            console.print()
-            console.print("[bold white]🐛 Bug Fix Workflow (for bug fixes):[/bold white]")
-            console.print("[dim]  /bug-create <bug-name>       - Start bug fix[/dim]")
-            console.print("[dim]  /bug-analyze                 - Analyze root cause[/dim]")
-            console.print("[dim]  /bug-fix                     - Implement fix[/dim]")
-            console.print("[dim]  /bug-verify                  - Verify fix[/dim]")
-            console.print("[dim]  /bug-status                  - Show bug status[/dim]")
-            console.print()
-            console.print("[yellow]Next steps:[/yellow]")
-            console.print("[dim]1. Run: claude[/dim]")
-            console.print("[dim]2. For new features: /spec-create my-feature[/dim]")
-            console.print("[dim]3. For bug fixes: /bug-create my-bug[/dim]")
-            console.print()
-            console.print("[blue]📖 For help, see the README or run /spec-list[/blue]")
+            _print_lines(console, _POST_SETUP_HELP)
             
         except Exception as error:
             progress.stop()
@@ -211,11 +366,18 @@ async def _setup_async(project: Optional[str], force: bool, yes: bool) -> None:
 @main.command()
 def test() -> None:
     """Test the setup in a temporary directory."""
+    import asyncio
+
     asyncio.run(_test_async())
 
 
 async def _test_async() -> None:
     """Async implementation of test command."""
+    import tempfile
+
+    from spec_driven_workflow.setup import SpecWorkflowSetup
+
+    console = _get_console()
     console.print("🧪 [cyan]Testing setup...[/cyan]")
     
     with tempfile.TemporaryDirectory(prefix='spec-workflow-test-') as temp_dir:
@@ -237,19 +399,26 @@ async def _test_async() -> None:
 @click.option("--format", type=click.Choice(["json", "yaml", "summary"]), default="summary", help="Output format")
 def migration_info(format: str) -> None:
     """Display migration compatibility information for existing .claude directory."""
-    asyncio.run(_migration_info_async(format))
+    _migration_info_sync(format)
+
+
+def _migration_info_sync(format: str) -> None:
+    """Implementation of migration-info command.
+    
+    Only the migration analysis is async, so the event loop runs just for that call.
+    """
+    import asyncio
 
+    from spec_driven_workflow.setup import SpecWorkflowSetup
 
-async def _migration_info_async(format: str) -> None:
-    """Async implementation of migration-info command."""
-    console = Console()
+    console = _get_console()
     
     try:
         project_path = Path.cwd()
         setup = SpecWorkflowSetup(project_path)
         
         with console.status("[bold green]Analyzing existing setup..."):
-            migration_info_data = await setup.get_migration_info()
+            migration_info_data = asyncio.run(setup.get_migration_info())
         
         has_existing = migration_info_data["has_existing_claude"]
         has_typescript = migration_info_data["has_typescript_installation"]
@@ -259,6 +428,7 @@ async def _migration_info_async(format: str) -> None:
         
         if format == "json":
             import json
+
             console.print_json(json.dumps(migration_info_data, indent=2))
         elif format == "yaml":
             try:
@@ -286,8 +456,7 @@ async def _migration_info_async(format: str) -> None:
                     console.print("✅ [green]Fully compatible with Python version[/green]")
                 else:
                     console.print("⚠️  [yellow]Compatibility issues detected:[/yellow]")
-                    for issue in issues:
-                        console.print(f"   • [dim]{issue}[/dim]")
+                    _print_lines(console, (f"   • [dim]{issue}[/dim]" for issue in issues))
             else:
                 console.print("❌ [yellow]No existing .claude directory found[/yellow]")
                 console.print("[dim]Run 'spec-setup' to initialize the workflow[/dim]")
@@ -302,25 +471,36 @@ async def _migration_info_async(format: str) -> None:
 @click.option('-p', '--project', default=None, help='Project directory (default: current directory)')
 def generate_task_commands(spec_name: str, project: Optional[str]) -> None:
     """Generate individual task commands for a spec."""
+    import asyncio
+
     asyncio.run(_generate_task_commands_async(spec_name, project))
 
 
 @main.command('auto-run-tasks')
 @click.argument('spec_name')
 @click.option('-p', '--project', default=None, help='Project directory (default: current directory)')
-@click.option('--mode', type=click.Choice(['automatic', 'interactive']), default='automatic', help='Execution mode')
-@click.option('--tasks', default=None, help='Task selection (e.g., "all", "1-3", "2,4,6")')
+@click.option('--mode', type=click.Choice(_MODE_CHOICES), default='automatic', help='Execution mode')
+@click.option('--tasks', default='all', help='Task selection (e.g., "all", "1-3", "2,4,6")')
 @click.option('--continue-on-error', is_flag=True, help='Continue execution after errors')
 @click.option('--resume-from', default=None, help='Resume from specific task ID')
 @click.option('--show-progress', is_flag=True, default=True, help='Show detailed progress')
 def auto_run_tasks(spec_name: str, project: Optional[str], mode: str, tasks: Optional[str], 
                    continue_on_error: bool, resume_from: Optional[str], show_progress: bool) -> None:
     """Execute all tasks for a spec automatically."""
+    import asyncio
+
     asyncio.run(_auto_run_tasks_async(spec_name, project, mode, tasks, continue_on_error, resume_from, show_progress))
 
 
 async def _generate_task_commands_async(spec_name: str, project: Optional[str]) -> None:
     """Async implementation of generate-task-commands."""
+    import asyncio
+
+    from spec_driven_workflow.auto_run_models import AutoRunOptions
+    from spec_driven_workflow.auto_runner import TaskAutoRunner
+    from spec_driven_workflow.task_generator import parse_tasks_from_markdown, generate_task_command
+
+    console = _get_console()
     console.print("🔧 [cyan]Generating task commands...[/cyan]")
     
     project_path = Path(project) if project else Path.cwd()
@@ -328,22 +508,17 @@ async def _generate_task_commands_async(spec_name: str, project: Optional[str])
     tasks_file = spec_dir / 'tasks.md'
     commands_spec_dir = project_path / '.claude' / 'commands' / spec_name
     
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
+    with _progress_or_null(console) as progress:
         task = progress.add_task(f"Generating commands for spec: {spec_name}", total=None)
         
         try:
-            # Check if tasks.md exists
-            if not tasks_file.exists():
+            # Read tasks.md; a missing file is reported without a separate exists() check
+            try:
+                tasks_content = tasks_file.read_text(encoding='utf-8')
+            except FileNotFoundError:
                 progress.stop()
                 console.print(f"[red]tasks.md not found at {tasks_file}[/red]")
-                raise click.ClickException(f"tasks.md not found at {tasks_file}")
-            
-            # Read tasks.md
-            tasks_content = tasks_file.read_text(encoding='utf-8')
+                raise click.ClickException(f"tasks.md not found at {tasks_file}") from None
             
             # Create spec commands directory
             commands_spec_dir.mkdir(parents=True, exist_ok=True)
@@ -351,10 +526,11 @@ async def _generate_task_commands_async(spec_name: str, project: Optional[str])
             # Parse tasks and generate commands
             tasks = parse_tasks_from_markdown(tasks_content)
             
-            task_count = 0
-            for parsed_task in tasks:
-                await generate_task_command(commands_spec_dir, spec_name, parsed_task)
-                task_count += 1
+            # Write all command files concurrently; the directory already exists
+            await asyncio.gather(
+                *(generate_task_command(commands_spec_dir, spec_name, parsed_task) for parsed_task in tasks)
+            )
+            task_count = len(tasks)
             
             progress.update(task, description=f"Generated {task_count} task commands for spec: {spec_name}")
             progress.stop_task(task)
@@ -362,58 +538,33 @@ async def _generate_task_commands_async(spec_name: str, project: Optional[str])
             
             console.print()
             console.print("[green]Generated commands:[/green]")
-            for parsed_task in tasks:
-                console.print(f"[dim]  /{spec_name}-task-{parsed_task.id} - {parsed_task.description}[/dim]")
+            _print_lines(
+                console,
+                (f"[dim]  /{spec_name}-task-{parsed_task.id} - {parsed_task.description}[/dim]" for parsed_task in tasks),
+            )
             
             # Workflow Integration: Offer auto-run as an option per Requirement 3.2
-            console.print()
-            console.print("[bold cyan]🚀 Workflow Options:[/bold cyan]")
-            console.print()
-            console.print("[yellow]Option 1: Individual Task Execution[/yellow]")
-            console.print("[bold yellow]RESTART REQUIRED: You must restart Claude Code for the new commands to be visible[/bold yellow]")
-            console.print()
-            console.print("[bold cyan]Instructions for the agent:[/bold cyan]")
-            console.print("[dim]Tell the user they must exit Claude Code and restart it using:[/dim]")
-            console.print("[white]- Run \"claude --continue\" to continue this conversation with new commands[/white]")
-            console.print("[white]- Or run \"claude\" to start a fresh session[/white]")
-            console.print("[dim]The restart is absolutely necessary for the new task commands to appear.[/dim]")
-            console.print()
-            console.print("[blue]After restart, you can use commands like:[/blue]")
+            _print_lines(console, _WORKFLOW_OPTIONS_INTRO)
             if tasks:
                 console.print(f"[dim]  /{spec_name}-task-{tasks[0].id}[/dim]")
                 if len(tasks) > 1:
                     console.print(f"[dim]  /{spec_name}-task-{tasks[1].id}[/dim]")
                 console.print("[dim]  etc.[/dim]")
             
-            console.print()
-            console.print("[yellow]Option 2: Automated Task Execution (NEW!)[/yellow]")
-            console.print("[green]Execute all tasks automatically without restart:[/green]")
-            console.print(f"[white]/auto-run-tasks {spec_name}[/white] - Execute all tasks automatically")
-            console.print(f"[white]/auto-run-tasks {spec_name} --mode interactive[/white] - Interactive execution with prompts")
-            console.print(f"[white]/auto-run-tasks {spec_name} --tasks 1-3[/white] - Execute specific task range")
-            console.print()
-            console.print("[bold green]✨ Auto-run benefits:[/bold green]")
-            console.print("[dim]• No restart required - start immediately[/dim]")
-            console.print("[dim]• Execute all tasks sequentially with progress tracking[/dim]")
-            console.print("[dim]• Interactive mode for step-by-step control[/dim]")
-            console.print("[dim]• Resume functionality if interrupted[/dim]")
-            console.print("[dim]• Comprehensive error handling and recovery options[/dim]")
+            _print_lines(console, (line.format(spec_name=spec_name) for line in _AUTO_RUN_OPTION_TEMPLATE))
             
             # Integration Enhancement: Offer auto-run prompt per Requirement 3.2
             console.print()
             if await _prompt_for_auto_run(spec_name, len(tasks)):
                 console.print("[cyan]🚀 Starting auto-run immediately...[/cyan]")
-                # Execute auto-run with default options
-                from spec_driven_workflow.auto_run_models import AutoRunOptions, ExecutionMode
+                # Execute auto-run with default options (automatic, all tasks, stop on error)
                 auto_runner = TaskAutoRunner(console)
-                options = AutoRunOptions(
-                    execution_mode=ExecutionMode.AUTOMATIC,
-                    task_selection="all",
-                    continue_on_error=False,
-                    show_detailed_progress=True
-                )
+                options = AutoRunOptions()
+                # The runner loads the spec from the cwd, so the tasks parsed above
+                # only stand in for its tasks.md when --project points there too
+                preparsed_tasks = tasks if project_path.resolve() == Path.cwd().resolve() else None
                 try:
-                    result = await auto_runner.run_all_tasks(spec_name, options)
+                    result = await auto_runner.run_all_tasks(spec_name, options, preparsed_tasks=preparsed_tasks)
                     console.print()
                     console.print("[bold green]🎉 Auto-run completed successfully![/bold green]")
                     console.print(f"[green]✅ {result.successful_tasks}/{result.total_tasks} tasks completed[/green]")
@@ -442,7 +593,16 @@ async def _prompt_for_auto_run(spec_name: str, task_count: int) -> bool:
     Returns:
         True if user wants to run auto-run immediately, False otherwise
     """
-    if INQUIRER_AVAILABLE:
+    import asyncio
+    import sys
+
+    # Nobody can answer in a non-interactive session (CI, piped stdin); don't block on it
+    if sys.stdin is None or sys.stdin.closed or not sys.stdin.isatty():
+        return False
+
+    console = _get_console()
+    inquirer = _get_inquirer()
+    if inquirer is not None:
         questions = [
             inquirer.List('action',
                         message=f'Would you like to execute all {task_count} tasks now with auto-run?',
@@ -453,7 +613,7 @@ async def _prompt_for_auto_run(spec_name: str, task_count: int) -> bool:
                         ],
                         default='yes')
         ]
-        answers = inquirer.prompt(questions)
+        answers = await asyncio.to_thread(inquirer.prompt, questions)
         if not answers:
             return False
         return answers['action'] == 'yes'
@@ -462,39 +622,57 @@ async def _prompt_for_auto_run(spec_name: str, task_count: int) -> bool:
         console.print(f"[bold]Execute all {task_count} tasks automatically now? (y/n)[/bold]")
         console.print("[dim]Press Enter for Yes, or 'n' for No[/dim]")
         
-        while True:
-            choice = input("Auto-run now? [Y/n]: ").lower().strip()
-            if choice in ['', 'y', 'yes']:
-                return True
-            elif choice in ['n', 'no']:
-                return False
-            else:
-                print("Please enter 'y' for yes or 'n' for no")
+        try:
+            choice = await asyncio.to_thread(input, "Auto-run now? [Y/n]: ")
+        except EOFError:
+            return False
+        # Anything other than a recognised answer is treated as No
+        return _AUTO_RUN_ANSWERS.get(choice.lower().strip(), False)
 
 
-async def _ensure_context7_mcp_server(console: Console, project_path: Path, project_types: list[str]) -> None:
+async def _ensure_context7_mcp_server(console: "Console", project_path: Path, project_types: list[str],
+                                      refresh: bool = False) -> None:
     """Ensure context7 MCP server is configured in Claude Code.
     
     Checks if the context7 MCP server is already configured and adds it if missing.
     This provides enhanced context capabilities for Claude Code workflows.
     Implements graceful degradation - setup continues even if server addition fails.
+    A successful check is remembered per project for a day, so repeat setups skip the claude CLI.
     
     Args:
         console: Rich Console instance for output
-        project_path: Path to the project being set up (unused but kept for compatibility)
+        project_path: Path to the project being set up, used to key the cached check
         project_types: List of detected project types (unused but kept for compatibility)
+        refresh: Ignore a cached successful check and query the claude CLI again
     """
+    import time
+
     from spec_driven_workflow.utils import ensure_context7_mcp_server
     
     console.print()
     console.print("[cyan]🔌 Checking context7 MCP server configuration...[/cyan]")
     
+    sentinel = _context7_sentinel(project_path)
+    if not refresh:
+        try:
+            if time.time() - sentinel.stat().st_mtime < _CONTEXT7_CACHE_TTL:
+                console.print("✓ [green]context7 MCP server (cached)[/green]")
+                return
+        except OSError:
+            pass
+    
     try:
         # Check and configure context7 MCP server
         success, message = await ensure_context7_mcp_server()
         
         if success:
             console.print(f"✓ [green]{message}[/green]")
+            try:
+                sentinel.parent.mkdir(parents=True, exist_ok=True)
+                sentinel.touch()
+            except OSError:
+                # An unwritable cache only means the next setup checks again
+                pass
         else:
             console.print(f"⚠️  [yellow]{message}[/yellow]")
             console.print("[dim]   context7 provides enhanced context for Claude Code workflows[/dim]")
@@ -509,26 +687,30 @@ async def _ensure_context7_mcp_server(console: Console, project_path: Path, proj
 async def _auto_run_tasks_async(spec_name: str, project: Optional[str], mode: str, tasks: Optional[str], 
                                continue_on_error: bool, resume_from: Optional[str], show_progress: bool) -> None:
     """Async implementation of auto-run-tasks command."""
+    from spec_driven_workflow.auto_run_models import AutoRunOptions, ExecutionMode
+    from spec_driven_workflow.auto_runner import TaskAutoRunner
+
+    console = _get_console()
     console.print("🚀 [cyan]Starting auto-run for spec tasks...[/cyan]")
     
     project_path = Path(project) if project else Path.cwd()
     spec_dir = project_path / '.claude' / 'specs' / spec_name
     tasks_file = spec_dir / 'tasks.md'
     
-    # Validate spec exists
-    if not spec_dir.exists():
-        console.print(f"[red]Spec directory not found: {spec_dir}[/red]")
-        raise click.ClickException(f"Spec '{spec_name}' not found")
-    
-    if not tasks_file.exists():
+    # Validate spec exists; one stat on the success path, the directory is only checked on failure
+    try:
+        tasks_file.stat()
+    except FileNotFoundError:
+        if not spec_dir.is_dir():
+            console.print(f"[red]Spec directory not found: {spec_dir}[/red]")
+            raise click.ClickException(f"Spec '{spec_name}' not found") from None
         console.print(f"[red]tasks.md not found at {tasks_file}[/red]")
-        raise click.ClickException(f"tasks.md not found for spec '{spec_name}'")
+        raise click.ClickException(f"tasks.md not found for spec '{spec_name}'") from None
     
     try:
         # Create auto-run options
-        execution_mode = ExecutionMode.AUTOMATIC if mode == 'automatic' else ExecutionMode.INTERACTIVE
         options = AutoRunOptions(
-            execution_mode=execution_mode,
+            execution_mode=ExecutionMode[mode.upper()],
             task_selection=tasks,
             continue_on_error=continue_on_error,
             show_detailed_progress=show_progress,
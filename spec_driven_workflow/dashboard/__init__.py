@@ -2,21 +2,55 @@
 
 This module provides dashboard functionality for monitoring and visualizing
 spec progress through both terminal-based and optional web interfaces.
+
+The public classes are imported on first access, so importing this package
+does not pull in watchdog or Rich's live/layout machinery.
 """
 
-from .cli import DashboardManager
-from .parser import SpecParser, SpecStatus, SteeringStatus
-from .watcher import SpecWatcher, SpecChangeEvent, GitChangeEvent, SteeringChangeEvent
-from .terminal import TerminalDashboard
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .cli import DashboardManager
+    from .parser import SpecParser, SpecStatus, SteeringStatus
+    from .watcher import SpecWatcher, SpecChangeEvent, GitChangeEvent, SteeringChangeEvent
+    from .terminal import TerminalDashboard
+
+# Public name -> submodule that defines it
+_LAZY = {
+    'DashboardManager': '.cli',
+    'TerminalDashboard': '.terminal',
+    'SpecParser': '.parser',
+    'SpecStatus': '.parser',
+    'SteeringStatus': '.parser',
+    'SpecWatcher': '.watcher',
+    'SpecChangeEvent': '.watcher',
+    'GitChangeEvent': '.watcher',
+    'SteeringChangeEvent': '.watcher',
+}
 
 __all__ = [
     'DashboardManager',
     'TerminalDashboard',
-    'SpecParser', 
+    'SpecParser',
     'SpecStatus',
     'SteeringStatus',
     'SpecWatcher',
     'SpecChangeEvent',
-    'GitChangeEvent', 
+    'GitChangeEvent',
     'SteeringChangeEvent'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public dashboard class on first access and cache it on the module."""
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
@@ -128,7 +128,7 @@ class MigrationValidator:
         for pattern in self.scan_patterns:
             for file_path in self.project_root.rglob(pattern):
                 # Skip files in excluded directories
-                if any(exc_dir in file_path.parts for exc_dir in self.exclude_dirs):
+                if not self.exclude_dirs.isdisjoint(file_path.parts):
                     continue
                     
                 # Skip our own spec files (which contain expected legacy references for documentation)
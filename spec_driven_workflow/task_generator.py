@@ -5,13 +5,20 @@ individual task commands without NPX dependency. Converted from
 reference/src/task-generator.ts to maintain identical parsing logic.
 """
 
+import asyncio
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import List, Optional
 
+# Patterns used by parse_tasks_from_markdown, compiled once at import time
+_TASK_LINE_RE = re.compile(r'^-\s*\[\s*\]\s*([0-9]+(?:\.[0-9]+)*)\s*\.?\s*(.+)$')
+_TASK_START_RE = re.compile(r'^-\s*\[\s*\]\s*[0-9]')
+_REQUIREMENTS_RE = re.compile(r'_Requirements:\s*(.+?)(?:_|$)')
+_LEVERAGE_RE = re.compile(r'_Leverage:\s*(.+?)(?:_|$)')
 
-@dataclass
+
+@dataclass(slots=True)
 class ParsedTask:
     """Represents a parsed task from tasks.md file.
     
@@ -22,6 +29,8 @@ class ParsedTask:
     description: str
     leverage: Optional[str] = None
     requirements: Optional[str] = None
+    # requirements split on ", " once at parse time for per-task results
+    requirements_list: tuple[str, ...] = field(default=(), repr=False, compare=False)
 
 
 def parse_tasks_from_markdown(content: str) -> List[ParsedTask]:
@@ -53,7 +62,7 @@ def parse_tasks_from_markdown(content: str) -> List[ParsedTask]:
         # Match task lines with flexible format:
         # Supports: "- [ ] 1. Task", "- [] 1 Task", "- [ ] 1.1. Task", etc.
         # Also handles various spacing and punctuation
-        task_match = re.match(r'^-\s*\[\s*\]\s*([0-9]+(?:\.[0-9]+)*)\s*\.?\s*(.+)$', trimmed_line)
+        task_match = _TASK_LINE_RE.match(trimmed_line)
         
         if task_match:
             # If we have a previous task, save it
@@ -73,19 +82,22 @@ def parse_tasks_from_markdown(content: str) -> List[ParsedTask]:
         # If we're in a task, look for metadata anywhere in the task block
         elif current_task and is_collecting_task_content:
             # Check if this line starts a new task section (to stop collecting)
-            if re.match(r'^-\s*\[\s*\]\s*[0-9]', trimmed_line):
+            if _TASK_START_RE.match(trimmed_line):
                 # This is the start of a new task, process it in the next iteration
                 i -= 1
                 is_collecting_task_content = False
                 continue
             
             # Check for _Requirements: anywhere in the line
-            requirements_match = re.search(r'_Requirements:\s*(.+?)(?:_|$)', line)
+            requirements_match = _REQUIREMENTS_RE.search(line)
             if requirements_match:
                 current_task.requirements = requirements_match.group(1).strip()
+                current_task.requirements_list = (
+                    tuple(current_task.requirements.split(", ")) if current_task.requirements else ()
+                )
             
             # Check for _Leverage: anywhere in the line
-            leverage_match = re.search(r'_Leverage:\s*(.+?)(?:_|$)', line)
+            leverage_match = _LEVERAGE_RE.search(line)
             if leverage_match:
                 current_task.leverage = leverage_match.group(1).strip()
             
@@ -205,5 +217,5 @@ After task completion, you can:
 - Check overall progress with /spec-status {spec_name}
 """
 
-    # Write the command file
-    command_file.write_text(content, encoding='utf-8')
\ No newline at end of file
+    # Write the command file off the event loop so gathered writes overlap
+    await asyncio.to_thread(command_file.write_text, content, encoding="utf-8")
\ No newline at end of file
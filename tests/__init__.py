@@ -0,0 +1 @@
+"""Tests for spec-driven workflow."""
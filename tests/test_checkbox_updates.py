@@ -0,0 +1,132 @@
+"""Tests for checking off completed tasks in tasks.md."""
+
+from pathlib import Path
+
+import pytest
+
+from spec_driven_workflow.auto_run_models import SpecContext
+from spec_driven_workflow.auto_runner import (
+    TaskAutoRunner,
+    _mark_checkbox_line,
+    _task_complete_pattern,
+)
+
+pytestmark = pytest.mark.unit
+
+
+class TestMarkCheckboxLine:
+    @pytest.mark.parametrize(
+        ("content", "expected"),
+        [
+            ("- [ ] 2 Task\n", "- [x] 2 Task\n"),
+            ("- [ ] 2. Task\n", "- [x] 2. Task\n"),
+            ("- [ ] 2", "- [x] 2"),
+            ("- [ ] 1 One\n- [ ] 2 Two\n", "- [ ] 1 One\n- [x] 2 Two\n"),
+        ],
+    )
+    def test_marks_canonical_line(self, content: str, expected: str) -> None:
+        assert _mark_checkbox_line(content, "2") == expected
+
+    def test_does_not_match_subtask_or_longer_id(self) -> None:
+        content = "- [ ] 2.1 Subtask\n- [ ] 20 Other\n- [ ] 2 Parent\n"
+
+        assert _mark_checkbox_line(content, "2") == (
+            "- [ ] 2.1 Subtask\n- [ ] 20 Other\n- [x] 2 Parent\n"
+        )
+
+    def test_ignores_marker_inside_a_line(self) -> None:
+        assert _mark_checkbox_line("Note: - [ ] 2 Task\n", "2") is None
+
+    def test_returns_none_for_non_canonical_spacing(self) -> None:
+        assert _mark_checkbox_line("-  [ ]  2 Task\n", "2") is None
+
+
+class TestTaskCompletePattern:
+    def test_marks_non_canonical_spacing(self) -> None:
+        content = "-  [ ]  2. Task\n"
+
+        assert _task_complete_pattern("2").sub(r"\1[x] \2", content) == (
+            "-  [x] 2. Task\n"
+        )
+
+    def test_does_not_match_subtask(self) -> None:
+        content = "-  [ ] 2.1 Subtask\n"
+
+        assert _task_complete_pattern("2").sub(r"\1[x] \2", content) == content
+
+    def test_escapes_task_id(self) -> None:
+        assert _task_complete_pattern("2.1").search("- [ ] 211 Task") is None
+
+    def test_pattern_is_cached(self) -> None:
+        assert _task_complete_pattern("3") is _task_complete_pattern("3")
+
+
+class TestFlushCompletions:
+    @pytest.fixture
+    def spec_context(self, tmp_path: Path) -> SpecContext:
+        return SpecContext(
+            spec_name="user-auth",
+            requirements_content="# Requirements",
+            design_content="# Design",
+            tasks_content="# Tasks",
+            spec_directory=tmp_path,
+        )
+
+    @pytest.mark.asyncio
+    async def test_marks_all_queued_tasks_in_one_rewrite(
+        self, spec_context: SpecContext
+    ) -> None:
+        tasks_md = spec_context.spec_directory / "tasks.md"
+        tasks_md.write_text(
+            "- [ ] 2.1 Subtask\n"
+            "-  [ ]  2. Parent\n"
+            "- [ ] 3 Other\n"
+            "- [ ] 4.2 Nested\n"
+            "-  [ ] 4 Last\n",
+            encoding="utf-8",
+        )
+        runner = TaskAutoRunner()
+        for task_id in ("2", "3", "4"):
+            runner._mark_task_complete(task_id)
+
+        await runner._flush_completions(spec_context)
+
+        assert tasks_md.read_text(encoding="utf-8") == (
+            "- [ ] 2.1 Subtask\n"
+            "-  [x] 2. Parent\n"
+            "- [x] 3 Other\n"
+            "- [ ] 4.2 Nested\n"
+            "-  [x] 4 Last\n"
+        )
+        assert not runner._pending_completions
+
+    @pytest.mark.asyncio
+    async def test_picks_up_external_edits_between_flushes(
+        self, spec_context: SpecContext
+    ) -> None:
+        tasks_md = spec_context.spec_directory / "tasks.md"
+        tasks_md.write_text("- [ ] 1 First\n- [ ] 2 Second\n", encoding="utf-8")
+        runner = TaskAutoRunner()
+
+        runner._mark_task_complete("1")
+        await runner._flush_completions(spec_context)
+        tasks_md.write_text(
+            tasks_md.read_text(encoding="utf-8") + "- [ ] 3 Added\n", encoding="utf-8"
+        )
+        runner._mark_task_complete("3")
+        await runner._flush_completions(spec_context)
+
+        assert tasks_md.read_text(encoding="utf-8") == (
+            "- [x] 1 First\n- [ ] 2 Second\n- [x] 3 Added\n"
+        )
+
+    @pytest.mark.asyncio
+    async def test_missing_file_is_reported_not_raised(
+        self, spec_context: SpecContext
+    ) -> None:
+        runner = TaskAutoRunner()
+        runner._mark_task_complete("1")
+
+        await runner._flush_completions(spec_context)
+
+        assert not runner._pending_completions
@@ -0,0 +1,100 @@
+"""Tests for execution state persistence."""
+
+import json
+
+import pytest
+
+from spec_driven_workflow.auto_run_models import (
+    AutoRunOptions,
+    ExecutionMode,
+    ExecutionState,
+    TaskStatus,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def _state(**overrides: object) -> ExecutionState:
+    values: dict[str, object] = {
+        "spec_name": "user-auth",
+        "start_time": 100.0,
+        "last_updated": 200.0,
+        "options": AutoRunOptions(
+            execution_mode=ExecutionMode.INTERACTIVE,
+            task_selection="1-3",
+            continue_on_error=True,
+            show_detailed_progress=False,
+            resume_from_task="2",
+            explicit_task_ids=["2", "3"],
+        ),
+        "completed_task_ids": ["1"],
+        "failed_task_ids": ["2"],
+        "skipped_task_ids": ["3"],
+        "current_task_id": "2",
+        "total_tasks": 3,
+        "interruption_reason": "Interrupted by user (Ctrl+C)",
+    }
+    values.update(overrides)
+    return ExecutionState(**values)  # type: ignore[arg-type]
+
+
+class TestExecutionStateRoundTrip:
+    def test_round_trip_through_json(self) -> None:
+        state = _state()
+
+        restored = ExecutionState.from_dict(json.loads(json.dumps(state.to_dict())))
+
+        assert restored == state
+        assert restored.options.execution_mode is ExecutionMode.INTERACTIVE
+
+    @pytest.mark.parametrize(
+        ("mode", "value"),
+        [
+            (ExecutionMode.AUTOMATIC, "automatic"),
+            (ExecutionMode.INTERACTIVE, "interactive"),
+        ],
+    )
+    def test_execution_mode_is_stored_by_name(
+        self, mode: ExecutionMode, value: str
+    ) -> None:
+        state = _state(options=AutoRunOptions(execution_mode=mode))
+
+        data = state.to_dict()
+
+        assert data["options"]["execution_mode"] == value
+        assert ExecutionState.from_dict(data).options.execution_mode is mode
+
+    def test_unknown_execution_mode_raises_key_error(self) -> None:
+        data = _state().to_dict()
+        data["options"] = {**data["options"], "execution_mode": "turbo"}
+
+        with pytest.raises(KeyError):
+            ExecutionState.from_dict(data)
+
+    def test_missing_fields_use_defaults(self) -> None:
+        state = ExecutionState.from_dict({"spec_name": "user-auth"})
+
+        assert state.options.execution_mode is ExecutionMode.AUTOMATIC
+        assert state.options.task_selection == "all"
+        assert state.completed_task_ids == []
+        assert state.total_tasks == 0
+
+    def test_restored_state_answers_membership_queries(self) -> None:
+        restored = ExecutionState.from_dict(_state().to_dict())
+
+        assert restored.is_task_done("1")
+        assert restored.is_task_done("3")
+        assert not restored.is_task_done("2")
+        assert restored.next_task_id == "2"
+
+
+class TestRecordTaskResult:
+    def test_retry_moves_task_from_failed_to_completed(self) -> None:
+        state = _state()
+
+        state.record_task_result("2", TaskStatus.SUCCESS)
+
+        assert state.completed_task_ids == ["1", "2"]
+        assert state.failed_task_ids == []
+        assert state.is_task_done("2")
+        assert state.next_task_id is None
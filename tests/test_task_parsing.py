@@ -0,0 +1,147 @@
+"""Tests for tasks.md parsing and task selection."""
+
+import pytest
+
+from spec_driven_workflow import auto_runner
+from spec_driven_workflow.auto_runner import TaskAutoRunner
+from spec_driven_workflow.task_generator import ParsedTask, parse_tasks_from_markdown
+
+pytestmark = pytest.mark.unit
+
+TASKS_MD = """# Implementation Plan
+
+- [ ] 1. Set up project structure
+  - Create package layout
+  - _Requirements: 1.1, 2.2_
+  - _Leverage: existing cli.py_
+
+- [ ] 2 Implement parser
+- [ ] 2.1. Parse task lines
+  - _Requirements: 3.1_
+- [] 2.2 Parse metadata
+- [x] 3. Already done
+- [ ] 10. Late task
+"""
+
+
+@pytest.fixture
+def runner() -> TaskAutoRunner:
+    return TaskAutoRunner()
+
+
+def _tasks(*task_ids: str) -> list[ParsedTask]:
+    return [
+        ParsedTask(id=task_id, description=f"Task {task_id}") for task_id in task_ids
+    ]
+
+
+def _parse_without_fast_path(
+    runner: TaskAutoRunner, selection: str, monkeypatch: pytest.MonkeyPatch
+) -> list[str]:
+    with monkeypatch.context() as patch:
+        patch.setattr(auto_runner, "_parse_selection_fast", lambda _selection: None)
+        return runner._parse_task_selection(selection)
+
+
+class TestParseTasksFromMarkdown:
+    def test_parses_ids_descriptions_and_metadata(self) -> None:
+        tasks = parse_tasks_from_markdown(TASKS_MD)
+
+        assert [task.id for task in tasks] == ["1", "2", "2.1", "2.2", "10"]
+        assert tasks[0].description == "Set up project structure"
+        assert tasks[0].requirements == "1.1, 2.2"
+        assert tasks[0].requirements_list == ("1.1", "2.2")
+        assert tasks[0].leverage == "existing cli.py"
+        assert tasks[2].description == "Parse task lines"
+        assert tasks[2].requirements == "3.1"
+        assert tasks[1].requirements is None
+        assert tasks[1].requirements_list == ()
+
+    def test_skips_checked_tasks(self) -> None:
+        tasks = parse_tasks_from_markdown("- [x] 1. Done\n- [ ] 2. Open\n")
+
+        assert [task.id for task in tasks] == ["2"]
+
+    def test_empty_content(self) -> None:
+        assert parse_tasks_from_markdown("") == []
+
+
+class TestParseTaskSelection:
+    @pytest.mark.parametrize(
+        ("selection", "expected"),
+        [
+            ("1", ["1"]),
+            ("1,3-5", ["1", "3", "4", "5"]),
+            ("2.1-2.3", ["2.1", "2.2", "2.3"]),
+            ("1, 2.1-2.2, 1", ["1", "2.1", "2.2"]),
+            ("1.2.1-1.2.3", ["1.2.1", "1.2.2", "1.2.3"]),
+        ],
+    )
+    def test_selection(
+        self, runner: TaskAutoRunner, selection: str, expected: list[str]
+    ) -> None:
+        assert runner._parse_task_selection(selection) == expected
+
+    @pytest.mark.parametrize(
+        "selection",
+        [
+            "1",
+            "1,3-5",
+            "2.1-2.3",
+            "1, 2.1-2.2, 1",
+            "01.1-01.2",
+            "1.2.1-1.2.4",
+            "3,,4",
+            " 7 ",
+        ],
+    )
+    def test_fast_path_matches_general_parser(
+        self, runner: TaskAutoRunner, selection: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        assert runner._parse_task_selection(selection) == _parse_without_fast_path(
+            runner, selection, monkeypatch
+        )
+
+    @pytest.mark.parametrize("selection", ["", "   ", "3-1", "2.3-2.1", "1-2-3", "a-b"])
+    def test_invalid_selection_raises(
+        self, runner: TaskAutoRunner, selection: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        with pytest.raises(ValueError) as fast_error:
+            runner._parse_task_selection(selection)
+        with pytest.raises(ValueError) as general_error:
+            _parse_without_fast_path(runner, selection, monkeypatch)
+
+        assert str(fast_error.value) == str(general_error.value)
+
+
+class TestFilterTasks:
+    def test_all_returns_hierarchical_order(self, runner: TaskAutoRunner) -> None:
+        tasks = _tasks("2.1", "10", "2", "1")
+
+        assert [task.id for task in runner._filter_tasks(tasks, "all")] == [
+            "1",
+            "2",
+            "2.1",
+            "10",
+        ]
+
+    def test_selection_keeps_duplicate_ids(self, runner: TaskAutoRunner) -> None:
+        tasks = _tasks("1", "2", "2", "3")
+
+        assert [task.id for task in runner._filter_tasks(tasks, "2-3")] == [
+            "2",
+            "2",
+            "3",
+        ]
+
+    def test_explicit_ids_override_selection(self, runner: TaskAutoRunner) -> None:
+        tasks = _tasks("1", "2", "3")
+
+        assert [
+            task.id
+            for task in runner._filter_tasks(tasks, "1", explicit_task_ids=["3", "2"])
+        ] == ["2", "3"]
+
+    def test_unknown_ids_raise(self, runner: TaskAutoRunner) -> None:
+        with pytest.raises(ValueError, match="Task IDs not found: 4"):
+            runner._filter_tasks(_tasks("1", "2"), "1,4")